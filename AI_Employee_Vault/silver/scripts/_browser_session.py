@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Shared Playwright session helper for the debug/test scripts.
+
+Starting the Playwright driver (~300-500ms) and launching Chromium
+(~1-2s) separately in every script dominates batched runs. This module
+keeps one driver per process and hands out persistent contexts from it,
+so scripts that run in the same process share the startup cost.
+"""
+
+import atexit
+from contextlib import contextmanager
+
+from playwright.sync_api import sync_playwright
+
+_driver = None
+
+
+def get_driver():
+    """Return the process-wide Playwright driver, starting it on first use."""
+    global _driver
+    if _driver is None:
+        _driver = sync_playwright().start()
+        atexit.register(stop_driver)
+    return _driver
+
+
+def stop_driver():
+    """Stop the shared driver if it is running."""
+    global _driver
+    if _driver is not None:
+        _driver.stop()
+        _driver = None
+
+
+@contextmanager
+def persistent_context(user_data_dir, headless=True, **kwargs):
+    """
+    Launch a persistent Chromium context on the shared driver.
+
+    Args:
+        user_data_dir: Browser session directory
+        headless: Whether to run without a visible window
+        **kwargs: Extra launch_persistent_context options
+
+    Yields:
+        The launched browser context (closed on exit)
+    """
+    browser = get_driver().chromium.launch_persistent_context(
+        user_data_dir=str(user_data_dir),
+        headless=headless,
+        args=['--no-sandbox', '--disable-setuid-sandbox'],
+        **kwargs
+    )
+    try:
+        yield browser
+    finally:
+        browser.close()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Shared helpers for the WhatsApp test scripts.
+
+Each script used to duplicate the persistent-context launch, the
+load-vs-QR race and the batched send sequence. Consolidating them here
+keeps the scripts down to their flow-specific lines and gives the send
+path one place to pick up optimizations.
+"""
+
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+VAULT_PATH = Path('/mnt/d/hamza/autonomous-ftes/AI_Employee_Vault')
+SESSION_PATH = VAULT_PATH / "silver" / "config" / "whatsapp_session"
+
+QR_SELECTOR = 'canvas[aria-label="Scan me!"]'
+# Terminal load states raced in one wait: QR canvas (not logged in), chat
+# list or search box (ready)
+READY_SELECTOR = (
+    f'{QR_SELECTOR}, '
+    'div[aria-label="Chat list"], div[contenteditable="true"][data-tab="3"]'
+)
+# Single grey tick (sent) or double tick (delivered)
+SENT_TICK_SELECTOR = 'span[data-icon="msg-check"], span[data-icon="msg-dblcheck"]'
+
+# Entire search->select->type->send interaction in one in-page script.
+# Each Python-side Playwright call is a CDP round-trip; batching the whole
+# sequence costs one.
+SEND_MESSAGE_JS = """async ([recipient, message, timeout]) => {
+    const delay = (ms) => new Promise(r => setTimeout(r, ms));
+    const waitFor = async (finder) => {
+        const deadline = Date.now() + timeout;
+        while (Date.now() < deadline) {
+            const el = finder();
+            if (el) return el;
+            await delay(100);
+        }
+        return null;
+    };
+    const type = (el, text) => {
+        el.focus();
+        document.execCommand('selectAll', false, null);
+        document.execCommand('insertText', false, text);
+    };
+
+    const search = await waitFor(
+        () => document.querySelector('div[contenteditable="true"][data-tab="3"]'));
+    if (!search) return 'search box not found';
+    search.click();
+    type(search, recipient);
+
+    const contact = await waitFor(
+        () => Array.from(document.querySelectorAll('span[title]'))
+            .find(e => e.title === recipient));
+    if (!contact) return `contact not found: ${recipient}`;
+    contact.click();
+
+    const box = await waitFor(
+        () => document.querySelector('div[contenteditable="true"][data-tab="10"]'));
+    if (!box) return 'message box not found';
+    type(box, message);
+    box.dispatchEvent(new KeyboardEvent('keydown',
+        {key: 'Enter', code: 'Enter', keyCode: 13, which: 13, bubbles: true}));
+    return null;
+}"""
+
+
+@asynccontextmanager
+async def whatsapp_session(session_path=SESSION_PATH, headless=False,
+                           ready_timeout=180000):
+    """
+    Launch the persistent WhatsApp context and yield a ready page.
+
+    Args:
+        session_path: Persistent browser profile directory
+        headless: Whether to run the browser headless
+        ready_timeout: Milliseconds to wait for the chat list/search box
+
+    Yields:
+        The logged-in WhatsApp Web page
+
+    Raises:
+        RuntimeError: If the QR login screen appears instead of the chat list
+    """
+    from playwright.async_api import async_playwright
+
+    async with async_playwright() as p:
+        browser = await p.chromium.launch_persistent_context(
+            user_data_dir=str(session_path),
+            headless=headless,
+            args=['--no-sandbox', '--disable-setuid-sandbox']
+        )
+        try:
+            page = browser.pages[0] if browser.pages else await browser.new_page()
+            await page.goto('https://web.whatsapp.com',
+                            wait_until='domcontentloaded', timeout=120000)
+            await page.wait_for_selector(READY_SELECTOR, timeout=ready_timeout)
+            if await page.locator(QR_SELECTOR).count() > 0:
+                raise RuntimeError(
+                    "QR code shown - session not authenticated. "
+                    "Run: python silver/scripts/setup_whatsapp.py"
+                )
+            yield page
+        finally:
+            await browser.close()
+
+
+async def send_message(page, recipient, message, contact_timeout=10000):
+    """
+    Send one message on a ready WhatsApp Web page.
+
+    Args:
+        page: Page yielded by whatsapp_session (or the daemon's page)
+        recipient: Contact name exactly as shown in WhatsApp
+        message: Message text to send
+        contact_timeout: Milliseconds each in-page wait is allowed to take
+
+    Raises:
+        ValueError: If the search box, contact or composer is not found
+    """
+    error = await page.evaluate(SEND_MESSAGE_JS, [recipient, message, contact_timeout])
+    if error:
+        raise ValueError(error)
+    # Wait for at least one tick so the send is actually acknowledged
+    await page.wait_for_selector(SENT_TICK_SELECTOR, timeout=15000)
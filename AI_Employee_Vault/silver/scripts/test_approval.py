@@ -8,6 +8,7 @@ This script creates test approval requests and verifies the workflow.
 import os
 import sys
 from pathlib import Path
+import asyncio
 import time
 
 # Add parent directory to path
@@ -108,7 +109,7 @@ def test_approval_checker(vault_path: str, config_path: str):
         # Test: Poll for approvals
         print("\n🔍 Polling for approval requests...")
 
-        approvals = checker.poll_for_approvals()
+        approvals = asyncio.run(checker.poll_for_approvals())
         print(f"   Found {len(approvals)} approval requests")
 
         if len(approvals) > 0:
@@ -225,7 +226,7 @@ def test_end_to_end(vault_path: str, config_path: str):
 
         for i in range(6):  # 6 iterations * 5 seconds = 30 seconds
             time.sleep(5)
-            approvals = checker.poll_for_approvals()
+            approvals = asyncio.run(checker.poll_for_approvals())
 
             for approval in approvals:
                 if approval["request_id"] == request_id:
@@ -11,6 +11,7 @@ This script demonstrates and tests the full HITL approval workflow:
 
 import sys
 from pathlib import Path
+import asyncio
 import time
 from datetime import datetime
 
@@ -118,7 +119,7 @@ def test_hitl_workflow():
 
     # Poll for approvals (single check)
     print("   Polling for approvals...")
-    approvals = checker.poll_for_approvals()
+    approvals = asyncio.run(checker.poll_for_approvals())
 
     if not approvals:
         print("   ❌ No approvals found!")
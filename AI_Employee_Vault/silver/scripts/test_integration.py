@@ -14,6 +14,7 @@ Tests the complete workflow:
 import os
 import sys
 from pathlib import Path
+import asyncio
 import time
 from datetime import datetime
 
@@ -30,6 +31,7 @@ from silver.src.actions.action_executor import ActionExecutor
 from silver.src.actions.email_sender import EmailSender
 from silver.src.utils import (
     setup_logging,
+    get_logger,
     read_file,
     write_file,
     parse_frontmatter,
@@ -37,6 +39,8 @@ from silver.src.utils import (
     ensure_directory_exists,
 )
 
+logger = get_logger("integration_test")
+
 
 def test_complete_workflow(vault_path: str, config_path: str) -> bool:
     """Test complete workflow from action creation to execution."""
@@ -128,7 +132,7 @@ This is a mock action created by the integration test to verify the complete wor
         # Step 6: Check for approval
         print("\nStep 6: Checking for approval...")
         checker = ApprovalChecker(vault_path, config_path)
-        approvals = checker.poll_for_approvals()
+        approvals = asyncio.run(checker.poll_for_approvals())
 
         approved = False
         for approval in approvals:
@@ -174,8 +178,7 @@ This is a mock action created by the integration test to verify the complete wor
 
     except Exception as e:
         print(f"\n❌ Complete workflow test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Complete workflow test failed")
         return False
 
 
@@ -298,8 +301,9 @@ def test_approval_workflow(vault_path: str, config_path: str) -> bool:
 
         # Test 2: Check if request is pending
         print("\nTest 2: Checking pending status...")
-        approvals = checker.poll_for_approvals()
-        pending = any(a["request_id"] == request_id and a["status"] == "pending" for a in approvals)
+        approvals = asyncio.run(checker.poll_for_approvals())
+        by_id = {a["request_id"]: a for a in approvals}
+        pending = by_id.get(request_id, {}).get("status") == "pending"
         if pending:
             print(f"   ✅ Request is pending: {request_id}")
         else:
@@ -320,8 +324,9 @@ def test_approval_workflow(vault_path: str, config_path: str) -> bool:
 
             # Test 4: Check for approval
             print("\nTest 4: Checking for approval...")
-            approvals = checker.poll_for_approvals()
-            approved = any(a["request_id"] == request_id and a["status"] == "approved" for a in approvals)
+            approvals = asyncio.run(checker.poll_for_approvals())
+            by_id = {a["request_id"]: a for a in approvals}
+            approved = by_id.get(request_id, {}).get("status") == "approved"
             if approved:
                 print(f"   ✅ Approval detected: {request_id}")
             else:
@@ -339,6 +344,9 @@ def test_approval_workflow(vault_path: str, config_path: str) -> bool:
 
 def main():
     """Main entry point."""
+    # Block-buffer stdout: one flush per test instead of one write() per print
+    sys.stdout.reconfigure(line_buffering=False, write_through=False)
+
     # Setup logging
     setup_logging(log_level="INFO", log_format="text")
 
@@ -354,13 +362,16 @@ def main():
     print("=" * 60)
     print()
 
-    # Run tests
-    results = {
-        "Complete Workflow": test_complete_workflow(vault_path, config_path),
-        "Error Handling": test_error_handling(vault_path, config_path),
-        "Plan Tracking": test_plan_tracking(vault_path),
-        "Approval Workflow": test_approval_workflow(vault_path, config_path),
-    }
+    # Run tests, flushing at suite boundaries
+    results = {}
+    results["Complete Workflow"] = test_complete_workflow(vault_path, config_path)
+    sys.stdout.flush()
+    results["Error Handling"] = test_error_handling(vault_path, config_path)
+    sys.stdout.flush()
+    results["Plan Tracking"] = test_plan_tracking(vault_path)
+    sys.stdout.flush()
+    results["Approval Workflow"] = test_approval_workflow(vault_path, config_path)
+    sys.stdout.flush()
 
     # Print summary
     print()
@@ -5,6 +5,7 @@ Fixed LinkedIn posting script with proper button targeting and verification.
 This script addresses the issue where the post appears to succeed but doesn't actually post.
 """
 
+import argparse
 import sys
 from pathlib import Path
 from dotenv import load_dotenv
@@ -17,11 +18,45 @@ from src.utils import get_logger
 
 # Playwright imports
 try:
-    from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeout
+    from playwright.sync_api import TimeoutError as PlaywrightTimeout
+    from _browser_session import persistent_context
     PLAYWRIGHT_AVAILABLE = True
 except ImportError:
     PLAYWRIGHT_AVAILABLE = False
 
+# Resources the posting flow never looks at - dropping them cuts feed load time
+_BLOCKED_RESOURCE_TYPES = {"image", "media", "font"}
+_BLOCKED_URL_PARTS = ("doubleclick", "ads.linkedin.com", "analytics", "bizographics")
+
+# Post-button selectors in order of preference, built once at import
+LINKEDIN_POST_SELECTORS = (
+    '[role="dialog"] button.share-actions__primary-action',  # Most specific
+    'button.share-actions__primary-action',                   # Primary action
+)
+LINKEDIN_POST_TEXT_FALLBACK = '[role="dialog"] button:has-text("Post"):not([disabled])'
+
+# Environment is static per process - load once at import, not per post
+VAULT_PATH = Path(__file__).parent.parent.parent
+_ENV_PATH = VAULT_PATH / "silver" / "config" / ".env"
+if _ENV_PATH.exists():
+    load_dotenv(_ENV_PATH)
+
+SESSION_PATH = os.getenv(
+    "LINKEDIN_SESSION_PATH",
+    str(VAULT_PATH / "silver" / "config" / "linkedin_session")
+)
+
+
+def _block_heavy_requests(route):
+    """Abort image/media/font and tracker requests, let everything else through."""
+    request = route.request
+    if request.resource_type in _BLOCKED_RESOURCE_TYPES or any(
+        part in request.url for part in _BLOCKED_URL_PARTS
+    ):
+        route.abort()
+    else:
+        route.continue_()
+
 
 def post_to_linkedin_fixed(content: str, headless: bool = False):
     """
@@ -41,20 +76,6 @@ def post_to_linkedin_fixed(content: str, headless: bool = False):
         print("❌ Playwright not installed")
         return False
 
-    # Get vault path
-    vault_path = Path(__file__).parent.parent.parent
-
-    # Load environment variables
-    env_path = vault_path / "silver" / "config" / ".env"
-    if env_path.exists():
-        load_dotenv(env_path)
-
-    # Get LinkedIn session path
-    session_path = os.getenv(
-        "LINKEDIN_SESSION_PATH",
-        str(vault_path / "silver" / "config" / "linkedin_session")
-    )
-
     print("=" * 60)
     print("LinkedIn Posting Script (FIXED)")
     print("=" * 60)
@@ -62,21 +83,24 @@ def post_to_linkedin_fixed(content: str, headless: bool = False):
     print("-" * 60)
 
     try:
-        with sync_playwright() as p:
-            print("\n1️⃣  Launching browser...")
-
-            browser = p.chromium.launch_persistent_context(
-                session_path,
-                headless=headless,
-                args=['--no-sandbox', '--disable-setuid-sandbox']
+        print("\n1️⃣  Launching browser...")
+        with persistent_context(SESSION_PATH, headless=headless) as browser:
+            # The persistent context already opens one blank page - reuse it
+            # instead of creating a second tab
+            page = browser.pages[0] if browser.pages else browser.new_page()
+
+            # Navigate to LinkedIn, dropping resources the script never uses
+            page.route("**/*", _block_heavy_requests)
+
+            # Deep-link straight to the share composer - skips rendering the
+            # full feed just to click "Start a post"
+            print("2️⃣  Navigating to LinkedIn composer...")
+            page.goto(
+                "https://www.linkedin.com/feed/?shareActive=true",
+                wait_until="domcontentloaded",
+                timeout=30000
             )
 
-            page = browser.new_page()
-
-            # Navigate to LinkedIn
-            print("2️⃣  Navigating to LinkedIn feed...")
-            page.goto("https://www.linkedin.com/feed/", wait_until="load", timeout=30000)
-
             # Check if logged in
             if "login" in page.url.lower() or "authwall" in page.url.lower():
                 print("\n❌ LinkedIn session expired!")
@@ -86,70 +110,67 @@ def post_to_linkedin_fixed(content: str, headless: bool = False):
 
             print("   ✅ Logged in successfully")
 
-            # Wait for page to load
-            print("\n3️⃣  Waiting for page to fully load...")
-            page.wait_for_timeout(3000)
-            print("   ✅ Page loaded")
-
-            # Click "Start a post"
-            print("\n4️⃣  Clicking 'Start a post' button...")
-            page.click('button:has-text("Start a post")', timeout=15000)
-            print("   ✅ Clicked 'Start a post'")
-
-            # Wait for editor to appear
-            print("\n5️⃣  Waiting for editor to appear...")
-            page.wait_for_selector('[role="textbox"]', timeout=10000)
+            # Wait for editor to appear; fall back to the feed button if the
+            # composer deep link is gated
+            print("\n3️⃣  Waiting for editor to appear...")
+            try:
+                page.wait_for_selector('[role="textbox"]', timeout=10000)
+            except PlaywrightTimeout:
+                print("   Composer deep link gated - opening via 'Start a post'")
+                page.click('button:has-text("Start a post")', timeout=15000)
+                page.wait_for_selector('[role="textbox"]', timeout=10000)
             print("   ✅ Editor appeared")
 
             # Fill content
             print("\n6️⃣  Filling content...")
             editor = page.locator('[role="textbox"]').first
             editor.click()
-            editor.fill(content)
+            # insertText routes through the browser editing pipeline in one
+            # shot instead of fill()'s per-keystroke React reconciliation
+            editor.evaluate(
+                "(el, text) => { el.focus(); document.execCommand('insertText', false, text); }",
+                content
+            )
             print("   ✅ Content filled")
 
             # CRITICAL: Wait for Post button to become enabled
             print("\n7️⃣  Waiting for Post button to be enabled...")
-            page.wait_for_timeout(2000)  # Give LinkedIn time to enable the button
+            try:
+                page.wait_for_selector(
+                    '[role="dialog"] button.share-actions__primary-action:not([disabled])',
+                    timeout=10000
+                )
+            except PlaywrightTimeout:
+                pass  # Fall through to the selector fallbacks below
 
             # Find the CORRECT Post button - the one inside the modal that's NOT disabled
             print("\n8️⃣  Finding the correct Post button...")
 
-            # Strategy: Use the most specific selector that targets the submit button
-            # The button inside the dialog that's not an aria-label button
-            correct_selector = '[role="dialog"] button.share-actions__primary-action'
-
-            # Fallback selectors in order of preference
-            selectors_to_try = [
-                '[role="dialog"] button.share-actions__primary-action',  # Most specific
-                'button.share-actions__primary-action',                   # Primary action
-                '[role="dialog"] button:has-text("Post"):not([disabled])', # Dialog Post not disabled
-            ]
+            # CSS selectors tried in one evaluate call (one CDP round-trip
+            # instead of count/first/is_disabled/click per selector)
+            clicked_selector = page.evaluate(
+                """(sels) => {
+                  for (const s of sels) {
+                    const el = document.querySelector(s);
+                    if (el && !el.disabled) { el.click(); return s; }
+                  }
+                  return null;
+                }""",
+                list(LINKEDIN_POST_SELECTORS)
+            )
+            clicked = clicked_selector is not None
 
-            clicked = False
-            for selector in selectors_to_try:
+            if clicked:
+                print(f"   ✅ Clicked using: {clicked_selector}")
+            else:
+                # Text-matching fallback needs Playwright's selector engine
                 try:
-                    count = page.locator(selector).count()
-                    if count > 0:
-                        # Check if button is enabled
-                        button = page.locator(selector).first
-                        is_disabled = button.is_disabled()
-
-                        print(f"   Trying: {selector}")
-                        print(f"   Found: {count}, Disabled: {is_disabled}")
-
-                        if not is_disabled:
-                            # Wait for button to be visible and enabled
-                            button.wait_for(state="visible", timeout=5000)
-
-                            # Click the button
-                            button.click(timeout=5000)
-                            print(f"   ✅ Clicked using: {selector}")
-                            clicked = True
-                            break
+                    button = page.locator(LINKEDIN_POST_TEXT_FALLBACK).first
+                    button.click(timeout=5000)
+                    print("   ✅ Clicked using text fallback")
+                    clicked = True
                 except Exception as e:
-                    print(f"   ❌ Failed with {selector}: {e}")
-                    continue
+                    print(f"   ❌ Text fallback failed: {e}")
 
             if not clicked:
                 print("\n❌ Could not click Post button")
@@ -159,8 +180,11 @@ def post_to_linkedin_fixed(content: str, headless: bool = False):
             # CRITICAL: Verify the post was submitted
             print("\n9️⃣  Verifying post submission...")
 
-            # Wait and check if modal closed (indicates successful post)
-            page.wait_for_timeout(3000)
+            # Wait for the modal to close (indicates successful post)
+            try:
+                page.wait_for_selector('[role="dialog"]', state='detached', timeout=10000)
+            except PlaywrightTimeout:
+                pass  # Modal still open - handled below
 
             modal_count = page.locator('[role="dialog"]').count()
             print(f"   Modal count after click: {modal_count}")
@@ -169,7 +193,6 @@ def post_to_linkedin_fixed(content: str, headless: bool = False):
                 print("   ✅ Modal closed - post submitted successfully!")
 
                 # Additional verification: Check if we're back on feed
-                page.wait_for_timeout(2000)
                 current_url = page.url
 
                 if "feed" in current_url:
@@ -184,7 +207,7 @@ def post_to_linkedin_fixed(content: str, headless: bool = False):
                 success = False
 
             # Take screenshot for verification
-            screenshot_path = vault_path / "linkedin_post_result.png"
+            screenshot_path = VAULT_PATH / "linkedin_post_result.png"
             page.screenshot(path=str(screenshot_path))
             print(f"\n📸 Screenshot saved: {screenshot_path}")
 
@@ -217,6 +240,14 @@ def post_to_linkedin_fixed(content: str, headless: bool = False):
 def main():
     """Main entry point."""
 
+    parser = argparse.ArgumentParser(description="LinkedIn posting fix test")
+    parser.add_argument(
+        "--headful",
+        action="store_true",
+        help="Show the browser window (default: headless)"
+    )
+    args = parser.parse_args()
+
     # Test content
     content = """🚀 Testing automated LinkedIn posting with improved button targeting!
 
@@ -227,8 +258,8 @@ This post is being made by an AI automation system that properly identifies and
     print("\n🔧 LinkedIn Posting Fix Test")
     print("   This script uses improved button targeting\n")
 
-    # Run with visible browser so user can see what happens
-    success = post_to_linkedin_fixed(content, headless=False)
+    # Headless by default; pass --headful to watch the browser
+    success = post_to_linkedin_fixed(content, headless=not args.headful)
 
     if success:
         print("\n✅ Success! Check your LinkedIn profile to verify the post.")
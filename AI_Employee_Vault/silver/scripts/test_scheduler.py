@@ -9,6 +9,7 @@ This script tests the scheduling system including:
 
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import time
 from datetime import datetime
@@ -21,7 +22,22 @@ from silver.src.scheduling.schedule_manager import ScheduleManager
 from silver.src.utils import setup_logging
 
 
-def test_scheduler(vault_path: str) -> bool:
+def wait_until(condition, timeout: float, poll: float = 0.2) -> bool:
+    """Poll a condition until it holds or the timeout expires.
+
+    Returns as soon as condition() is truthy instead of sleeping for the
+    full timeout, so tests finish the moment their acceptance condition
+    is met.
+    """
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if condition():
+            return True
+        time.sleep(poll)
+    return bool(condition())
+
+
+def test_scheduler(scheduler: Scheduler) -> bool:
     """Test Scheduler functionality."""
     print("=" * 60)
     print("Testing Scheduler")
@@ -29,8 +45,7 @@ def test_scheduler(vault_path: str) -> bool:
     print()
 
     try:
-        scheduler = Scheduler(vault_path)
-        print("✅ Scheduler initialized")
+        print("✅ Scheduler ready")
 
         # Test: Schedule a task
         print("\n📋 Testing task scheduling...")
@@ -69,9 +84,9 @@ def test_scheduler(vault_path: str) -> bool:
         scheduler.start()
         print("   ✅ Scheduler started")
 
-        # Run for 15 seconds
-        print("\n⏳ Running for 15 seconds...")
-        time.sleep(15)
+        # Wait until the interval task has fired at least twice (max 15s)
+        print("\n⏳ Waiting for task executions...")
+        wait_until(lambda: execution_count[0] >= 2, timeout=15)
 
         # Test: Get stats
         print("\n📊 Testing scheduler statistics...")
@@ -108,7 +123,7 @@ def test_scheduler(vault_path: str) -> bool:
         return False
 
 
-def test_schedule_manager(vault_path: str) -> bool:
+def test_schedule_manager(manager: ScheduleManager) -> bool:
     """Test ScheduleManager functionality."""
     print()
     print("=" * 60)
@@ -117,8 +132,7 @@ def test_schedule_manager(vault_path: str) -> bool:
     print()
 
     try:
-        manager = ScheduleManager(vault_path)
-        print("✅ ScheduleManager initialized")
+        print("✅ ScheduleManager ready")
 
         # Test: Add schedule
         print("\n📋 Testing add schedule...")
@@ -245,7 +259,7 @@ def test_schedule_manager(vault_path: str) -> bool:
         return False
 
 
-def test_integration(vault_path: str) -> bool:
+def test_integration(scheduler: Scheduler, manager: ScheduleManager) -> bool:
     """Test integration between Scheduler and ScheduleManager."""
     print()
     print("=" * 60)
@@ -254,10 +268,7 @@ def test_integration(vault_path: str) -> bool:
     print()
 
     try:
-        scheduler = Scheduler(vault_path)
-        manager = ScheduleManager(vault_path)
-
-        print("✅ Components initialized")
+        print("✅ Components ready")
 
         # Step 1: Add schedules to manager
         print("\nStep 1: Adding schedules to manager...")
@@ -313,9 +324,12 @@ def test_integration(vault_path: str) -> bool:
         scheduler.start()
         print("   ✅ Scheduler started")
 
-        # Step 4: Run for 20 seconds
-        print("\nStep 4: Running for 20 seconds...")
-        time.sleep(20)
+        # Step 4: Wait until both tasks have executed (max 20s)
+        print("\nStep 4: Waiting for task executions...")
+        wait_until(
+            lambda: all(count > 0 for count in execution_counts.values()),
+            timeout=20
+        )
 
         # Step 5: Check execution
         print("\nStep 5: Checking execution...")
@@ -352,7 +366,7 @@ def test_integration(vault_path: str) -> bool:
         return False
 
 
-def test_schedule_types(vault_path: str) -> bool:
+def test_schedule_types(scheduler: Scheduler) -> bool:
     """Test different schedule types."""
     print()
     print("=" * 60)
@@ -361,52 +375,44 @@ def test_schedule_types(vault_path: str) -> bool:
     print()
 
     try:
-        scheduler = Scheduler(vault_path)
-        print("✅ Scheduler initialized")
-
-        # Test: Daily schedule
-        print("\n📋 Testing daily schedule...")
-        success = scheduler.schedule_task(
-            task_id="test_daily",
-            task_func=lambda: print("Daily task executed"),
-            schedule_type="daily",
-            schedule_config={"time": "09:00"},
-            description="Daily task at 9 AM"
-        )
-        print(f"   {'✅' if success else '❌'} Daily schedule")
-
-        # Test: Weekly schedule
-        print("\n📋 Testing weekly schedule...")
-        success = scheduler.schedule_task(
-            task_id="test_weekly",
-            task_func=lambda: print("Weekly task executed"),
-            schedule_type="weekly",
-            schedule_config={"day": "monday", "time": "10:00"},
-            description="Weekly task on Monday at 10 AM"
-        )
-        print(f"   {'✅' if success else '❌'} Weekly schedule")
-
-        # Test: Monthly schedule
-        print("\n📋 Testing monthly schedule...")
-        success = scheduler.schedule_task(
-            task_id="test_monthly",
-            task_func=lambda: print("Monthly task executed"),
-            schedule_type="monthly",
-            schedule_config={"day": 1, "time": "09:00"},
-            description="Monthly task on 1st at 9 AM"
-        )
-        print(f"   {'✅' if success else '❌'} Monthly schedule")
+        print("✅ Scheduler ready")
+
+        # Test: All four schedule types registered through the batch API
+        print("\n📋 Testing all schedule types in one batch...")
+        batch = [
+            {
+                "task_id": "test_daily",
+                "task_func": lambda: print("Daily task executed"),
+                "schedule_type": "daily",
+                "schedule_config": {"time": "09:00"},
+                "description": "Daily task at 9 AM",
+            },
+            {
+                "task_id": "test_weekly",
+                "task_func": lambda: print("Weekly task executed"),
+                "schedule_type": "weekly",
+                "schedule_config": {"day": "monday", "time": "10:00"},
+                "description": "Weekly task on Monday at 10 AM",
+            },
+            {
+                "task_id": "test_monthly",
+                "task_func": lambda: print("Monthly task executed"),
+                "schedule_type": "monthly",
+                "schedule_config": {"day": 1, "time": "09:00"},
+                "description": "Monthly task on 1st at 9 AM",
+            },
+            {
+                "task_id": "test_interval",
+                "task_func": lambda: print("Interval task executed"),
+                "schedule_type": "interval",
+                "schedule_config": {"interval": 30, "unit": "minutes"},
+                "description": "Interval task every 30 minutes",
+            },
+        ]
 
-        # Test: Interval schedule
-        print("\n📋 Testing interval schedule...")
-        success = scheduler.schedule_task(
-            task_id="test_interval",
-            task_func=lambda: print("Interval task executed"),
-            schedule_type="interval",
-            schedule_config={"interval": 30, "unit": "minutes"},
-            description="Interval task every 30 minutes"
-        )
-        print(f"   {'✅' if success else '❌'} Interval schedule")
+        results = scheduler.schedule_tasks(batch)
+        for spec, success in zip(batch, results):
+            print(f"   {'✅' if success else '❌'} {spec['schedule_type'].capitalize()} schedule")
 
         # Get all scheduled tasks
         print("\n📋 All scheduled tasks:")
@@ -441,13 +447,27 @@ def main():
     print("=" * 60)
     print()
 
-    # Run tests
-    results = {
-        "Scheduler": test_scheduler(vault_path),
-        "ScheduleManager": test_schedule_manager(vault_path),
-        "Integration": test_integration(vault_path),
-        "Schedule Types": test_schedule_types(vault_path),
-    }
+    # The three independent tests run in parallel, each against an isolated
+    # vault sub-directory so their persistence files don't race; wall-clock
+    # becomes max(t_i) instead of sum(t_i)
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        scheduler_future = executor.submit(
+            test_scheduler, Scheduler(str(Path(vault_path) / "_t1")))
+        manager_future = executor.submit(
+            test_schedule_manager, ScheduleManager(str(Path(vault_path) / "_t2")))
+        types_future = executor.submit(
+            test_schedule_types, Scheduler(str(Path(vault_path) / "_t3")))
+
+        results = {
+            "Scheduler": scheduler_future.result(),
+            "ScheduleManager": manager_future.result(),
+            "Schedule Types": types_future.result(),
+        }
+
+    # The integration test orders Scheduler and ScheduleManager explicitly,
+    # so it runs on its own against the main vault
+    results["Integration"] = test_integration(
+        Scheduler(vault_path), ScheduleManager(vault_path))
 
     # Print summary
     print()
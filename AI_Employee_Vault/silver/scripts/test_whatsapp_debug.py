@@ -3,6 +3,7 @@
 WhatsApp Debug Test - Takes screenshots to see what's happening
 """
 
+import asyncio
 import sys
 import os
 from pathlib import Path
@@ -12,8 +13,8 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 os.environ['WHATSAPP_HEADLESS'] = 'false'
 os.environ['WHATSAPP_TIMEOUT'] = '90000'
 
-from playwright.sync_api import sync_playwright
-import time
+from playwright.async_api import expect
+from _whatsapp_lib import whatsapp_session
 
 print("=" * 70)
 print("WhatsApp Debug Test - With Screenshots")
@@ -25,6 +26,18 @@ session_path = vault_path / "silver" / "config" / "whatsapp_session"
 screenshots_path = vault_path / "silver" / "debug_screenshots"
 screenshots_path.mkdir(exist_ok=True)
 
+# Success-path screenshots are opt-in: each one forces a full raster +
+# encode + disk write. Failure-path screenshots stay unconditional.
+DEBUG_SCREENSHOTS = os.getenv('WA_DEBUG_SHOTS') == '1'
+
+
+async def save_screenshot(page, name):
+    """Save a viewport JPEG screenshot (much cheaper to encode than PNG)."""
+    path = screenshots_path / f"{name}.jpg"
+    await page.screenshot(path=str(path), full_page=False, type='jpeg', quality=60)
+    print(f"   📸 Screenshot saved: {path}")
+
+
 recipient = "Mr Honey 😎"
 message = "🧪 Test from AI Employee - WhatsApp working!"
 
@@ -33,107 +46,103 @@ print(f"Message: {message}")
 print(f"Screenshots will be saved to: {screenshots_path}")
 print()
 
-try:
-    with sync_playwright() as p:
-        print("1. Opening browser...")
-        browser = p.chromium.launch_persistent_context(
-            user_data_dir=str(session_path),
-            headless=False,
-            args=['--no-sandbox', '--disable-setuid-sandbox']
-        )
-
-        page = browser.pages[0] if browser.pages else browser.new_page()
-
-        print("2. Going to WhatsApp Web...")
-        page.goto('https://web.whatsapp.com', timeout=90000)
-
-        print("3. Waiting for WhatsApp to load (30 seconds)...")
-        time.sleep(30)
 
+async def main():
+    print("1. Opening browser and waiting for WhatsApp to load...")
+    # whatsapp_session handles launch, navigation and the load-vs-QR race
+    async with whatsapp_session(session_path, headless=False,
+                                ready_timeout=60000) as page:
         # Take screenshot after load
-        screenshot1 = screenshots_path / "01_after_load.png"
-        page.screenshot(path=str(screenshot1))
-        print(f"   📸 Screenshot saved: {screenshot1}")
+        if DEBUG_SCREENSHOTS:
+            await save_screenshot(page, "01_after_load")
 
-        print("4. Looking for search box...")
+        print("2. Looking for search box...")
 
         # Try to find and click search box
         try:
             search_box = page.locator('div[contenteditable="true"][data-tab="3"]')
-            search_box.click()
-            time.sleep(1)
+            await search_box.click()
             print("   ✅ Search box found and clicked")
 
             # Take screenshot after clicking search
-            screenshot2 = screenshots_path / "02_search_clicked.png"
-            page.screenshot(path=str(screenshot2))
-            print(f"   📸 Screenshot saved: {screenshot2}")
+            if DEBUG_SCREENSHOTS:
+                await save_screenshot(page, "02_search_clicked")
 
         except Exception as e:
             print(f"   ❌ Could not click search box: {e}")
             screenshot_error = screenshots_path / "error_search_box.png"
-            page.screenshot(path=str(screenshot_error))
+            await page.screenshot(path=str(screenshot_error))
             print(f"   📸 Error screenshot saved: {screenshot_error}")
             raise
 
-        print(f"5. Typing '{recipient}' in search...")
-        search_box.fill(recipient)
-        time.sleep(3)
+        print(f"3. Typing '{recipient}' in search...")
+        await search_box.fill(recipient)
+        try:
+            await page.wait_for_selector(f'span[title="{recipient}"]', timeout=10000)
+        except Exception:
+            pass  # Contact may not match exactly - the title dump below shows why
 
         # Take screenshot after typing
-        screenshot3 = screenshots_path / "03_after_typing.png"
-        page.screenshot(path=str(screenshot3))
-        print(f"   📸 Screenshot saved: {screenshot3}")
-
-        print("6. Looking for contact in results...")
-
-        # Try to find all spans with title attribute
-        all_titles = page.locator('span[title]').all()
-        print(f"   Found {len(all_titles)} elements with title attribute:")
-        for i, elem in enumerate(all_titles[:10]):  # Show first 10
-            try:
-                title = elem.get_attribute('title')
-                print(f"     - {title}")
-            except:
-                pass
-
-        # Try exact match
+        if DEBUG_SCREENSHOTS:
+            await save_screenshot(page, "03_after_typing")
+
+        print("4. Looking for contact in results...")
+
+        # Grab the first 10 span titles in one evaluate call instead of one
+        # CDP round-trip per element
+        titles = await page.evaluate(
+            "Array.from(document.querySelectorAll('span[title]')).slice(0, 10).map(e => e.title)"
+        )
+        print(f"   Found {len(titles)} elements with title attribute:")
+        for title in titles:
+            print(f"     - {title}")
+
+        # Try exact match - expect() uses Playwright's event-driven waiter
+        # instead of is_visible's 100ms polling
         contact = page.locator(f'span[title="{recipient}"]').first
 
-        if contact.is_visible(timeout=5000):
+        try:
+            await expect(contact).to_be_visible(timeout=5000)
+            contact_visible = True
+        except AssertionError:
+            contact_visible = False
+
+        if contact_visible:
             print(f"   ✅ Found contact: {recipient}")
-            contact.click()
-            time.sleep(2)
+            await contact.click()
+            await page.wait_for_selector('div[contenteditable="true"][data-tab="10"]', timeout=10000)
 
             # Take screenshot after clicking contact
-            screenshot4 = screenshots_path / "04_contact_clicked.png"
-            page.screenshot(path=str(screenshot4))
-            print(f"   📸 Screenshot saved: {screenshot4}")
+            if DEBUG_SCREENSHOTS:
+                await save_screenshot(page, "04_contact_clicked")
 
-            print("7. Sending message...")
+            print("5. Sending message...")
 
             # Find message box
             message_box = page.locator('div[contenteditable="true"][data-tab="10"]').first
-            message_box.click()
-            time.sleep(1)
-            message_box.fill(message)
-            time.sleep(1)
-            message_box.press('Enter')
+            await message_box.click()
+            await message_box.fill(message)
+            await message_box.press('Enter')
 
-            time.sleep(2)
+            # Wait for the sent checkmark instead of sleeping
+            await page.wait_for_selector(
+                'span[data-icon="msg-check"], span[data-icon="msg-dblcheck"]',
+                timeout=15000
+            )
 
             # Take screenshot after sending
-            screenshot5 = screenshots_path / "05_message_sent.png"
-            page.screenshot(path=str(screenshot5))
-            print(f"   📸 Screenshot saved: {screenshot5}")
+            if DEBUG_SCREENSHOTS:
+                await save_screenshot(page, "05_message_sent")
 
             print()
             print("✅ Message sent successfully!")
             print()
             print("Check your WhatsApp to verify!")
 
-            time.sleep(5)
-            browser.close()
+            # Delivery is already confirmed by the sent tick - only hold the
+            # browser open when someone wants to watch
+            if os.getenv('WHATSAPP_KEEP_OPEN') == '1':
+                await asyncio.sleep(5)
 
             print()
             print("=" * 70)
@@ -145,15 +154,19 @@ try:
 
             # Take screenshot of failed search
             screenshot_fail = screenshots_path / "error_contact_not_found.png"
-            page.screenshot(path=str(screenshot_fail))
+            await page.screenshot(path=str(screenshot_fail))
             print(f"   📸 Screenshot saved: {screenshot_fail}")
 
             print()
             print("   Keeping browser open for 30 seconds so you can inspect...")
-            time.sleep(30)
-            browser.close()
+            await asyncio.sleep(30)
             sys.exit(1)
 
+
+try:
+    asyncio.run(main())
+except SystemExit:
+    raise
 except Exception as e:
     print(f"❌ Failed: {e}")
     import traceback
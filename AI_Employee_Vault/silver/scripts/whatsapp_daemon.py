@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+WhatsApp send daemon - one logged-in browser session shared by all scripts.
+
+Every test script used to launch its own persistent Chromium context, paying
+2-5s of process startup plus 30-900s of WhatsApp Web chat-list sync per run.
+This daemon boots the browser once, waits for the chat list, then serves
+send requests over a Unix socket; the test scripts connect as thin clients,
+so each additional send costs only the send itself (~1-3s).
+
+Usage:
+    python silver/scripts/whatsapp_daemon.py
+
+Protocol: one JSON object per line per connection:
+    {"recipient": "Contact Name", "message": "text"}
+Response:
+    {"ok": true} or {"ok": false, "error": "..."}
+"""
+
+import asyncio
+import json
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+vault_path = Path('/mnt/d/hamza/autonomous-ftes/AI_Employee_Vault')
+session_path = vault_path / "silver" / "config" / "whatsapp_session"
+
+SOCKET_PATH = Path(os.getenv(
+    "WHATSAPP_DAEMON_SOCKET",
+    str(vault_path / "silver" / "config" / "whatsapp_daemon.sock")
+))
+
+# Entire search->select->type->send interaction in one in-page script.
+# Each Python-side Playwright call is a CDP round-trip; batching the whole
+# sequence costs one.
+SEND_MESSAGE_JS = """async ([recipient, message]) => {
+    const delay = (ms) => new Promise(r => setTimeout(r, ms));
+    const waitFor = async (finder, timeout) => {
+        const deadline = Date.now() + timeout;
+        while (Date.now() < deadline) {
+            const el = finder();
+            if (el) return el;
+            await delay(100);
+        }
+        return null;
+    };
+    const type = (el, text) => {
+        el.focus();
+        document.execCommand('selectAll', false, null);
+        document.execCommand('insertText', false, text);
+    };
+
+    const search = await waitFor(
+        () => document.querySelector('div[contenteditable="true"][data-tab="3"]'), 10000);
+    if (!search) return 'search box not found';
+    search.click();
+    type(search, recipient);
+
+    const contact = await waitFor(
+        () => Array.from(document.querySelectorAll('span[title]'))
+            .find(e => e.title === recipient), 10000);
+    if (!contact) return `contact not found: ${recipient}`;
+    contact.click();
+
+    const box = await waitFor(
+        () => document.querySelector('div[contenteditable="true"][data-tab="10"]'), 10000);
+    if (!box) return 'message box not found';
+    type(box, message);
+    box.dispatchEvent(new KeyboardEvent('keydown',
+        {key: 'Enter', code: 'Enter', keyCode: 13, which: 13, bubbles: true}));
+    return null;
+}"""
+
+
+def send_via_daemon(recipient: str, message: str,
+                    socket_path: Path = SOCKET_PATH,
+                    timeout: float = 120.0):
+    """
+    Thin-client helper: send one message through a running daemon.
+
+    Args:
+        recipient: Contact name exactly as shown in WhatsApp
+        message: Message text to send
+        socket_path: Unix socket the daemon is listening on
+        timeout: Socket timeout in seconds
+
+    Returns:
+        Tuple of (ok, error) - error is None on success
+    """
+    import socket
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(str(socket_path))
+        request = json.dumps({"recipient": recipient, "message": message})
+        sock.sendall(request.encode() + b"\n")
+
+        data = b""
+        while not data.endswith(b"\n"):
+            chunk = sock.recv(4096)
+            if not chunk:
+                break
+            data += chunk
+
+    response = json.loads(data.decode())
+    return response.get("ok", False), response.get("error")
+
+
+class WhatsAppDaemon:
+    """Owns the single logged-in WhatsApp Web page and serializes sends."""
+
+    def __init__(self):
+        self.page = None
+        self.browser = None
+        # WhatsApp Web has one search box - sends must not interleave
+        self._send_lock = asyncio.Lock()
+
+    async def start_browser(self):
+        """Launch the persistent context once and wait for the chat list."""
+        from playwright.async_api import async_playwright
+
+        print("1. Opening browser...")
+        playwright = await async_playwright().start()
+        self.browser = await playwright.chromium.launch_persistent_context(
+            user_data_dir=str(session_path),
+            headless=True,
+            args=['--no-sandbox', '--disable-setuid-sandbox']
+        )
+        self.page = self.browser.pages[0] if self.browser.pages else await self.browser.new_page()
+
+        print("2. Going to WhatsApp Web...")
+        await self.page.goto('https://web.whatsapp.com',
+                             wait_until='domcontentloaded', timeout=120000)
+
+        print("3. Waiting for chat list (one-time cost)...")
+        qr_code = self.page.locator('canvas[aria-label="Scan me!"]')
+        if await qr_code.is_visible(timeout=2000):
+            print("❌ QR CODE FOUND - Session not authenticated!")
+            print("   Run: python silver/scripts/setup_whatsapp.py")
+            sys.exit(1)
+
+        await self.page.wait_for_selector(
+            'div[aria-label="Chat list"], div[contenteditable="true"][data-tab="3"]',
+            timeout=900000
+        )
+        print("✅ WhatsApp ready - serving send requests")
+
+    async def send(self, recipient: str, message: str):
+        """Send one message on the shared page; returns error string or None."""
+        async with self._send_lock:
+            error = await self.page.evaluate(SEND_MESSAGE_JS, [recipient, message])
+            if error:
+                return error
+            # Wait for at least one tick (sent) before acknowledging
+            await self.page.wait_for_selector(
+                'span[data-icon="msg-check"], span[data-icon="msg-dblcheck"]',
+                timeout=15000
+            )
+            return None
+
+    async def handle_client(self, reader, writer):
+        """Serve one JSON request per connection."""
+        try:
+            line = await reader.readline()
+            request = json.loads(line.decode())
+            error = await self.send(request["recipient"], request["message"])
+            response = {"ok": error is None}
+            if error:
+                response["error"] = error
+        except Exception as e:
+            response = {"ok": False, "error": str(e)}
+
+        writer.write(json.dumps(response).encode() + b"\n")
+        await writer.drain()
+        writer.close()
+        await writer.wait_closed()
+
+
+async def main():
+    daemon = WhatsAppDaemon()
+    await daemon.start_browser()
+
+    # Clear a stale socket from a previous run
+    if SOCKET_PATH.exists():
+        SOCKET_PATH.unlink()
+
+    server = await asyncio.start_unix_server(daemon.handle_client, path=str(SOCKET_PATH))
+    print(f"Listening on {SOCKET_PATH}")
+    print("Stop with Ctrl+C")
+
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        if SOCKET_PATH.exists():
+            SOCKET_PATH.unlink()
+        if daemon.browser:
+            await daemon.browser.close()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        print("\nDaemon stopped")
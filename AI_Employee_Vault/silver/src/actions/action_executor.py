@@ -5,19 +5,34 @@ This module orchestrates action execution, routing actions to appropriate
 handlers, managing retry logic, and tracking results.
 """
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Callable
 from datetime import datetime
+import os
+import re
 import time
+import types
 import logging
 
+# "**Key**: Value" lines in action bodies - compiled once, scanned with a
+# single multiline pass instead of a per-line split/replace chain
+_KV_RE = re.compile(r'^\*\*([^*]+)\*\*:\s*(.+)$', re.MULTILINE)
+
+# The body's status line - rewritten in place without scanning the whole
+# body for an exact "**Status**: ✅ Approved" match
+_STATUS_RE = re.compile(r'^\*\*Status\*\*:.*$', re.MULTILINE)
+
+# Frontmatter fields sniffed from the raw file head for the fast-reject
+# path - no decode, no YAML parse
+_HEAD_TYPE_RE = re.compile(rb'^action_type:\s*(\S+)', re.MULTILINE)
+_HEAD_ID_RE = re.compile(rb'^id:\s*(\S+)', re.MULTILINE)
+
 from ..utils import (
     get_logger,
     parse_frontmatter,
     serialize_frontmatter,
     read_file,
-    write_file,
-    move_file,
     list_files,
 )
 from ..approval.approval_manager import ApprovalManager
@@ -48,16 +63,32 @@ class ActionExecutor:
         self.done_folder = self.vault_path / "Done"
         self.failed_folder = self.vault_path / "Failed"
 
+        # Destination dirs as plain strings - lets the per-action move be a
+        # single os.path.join + os.replace with no Path arithmetic
+        self._done_str = str(self.done_folder)
+        self._failed_str = str(self.failed_folder)
+
         # Initialize approval manager
         self.approval_manager = ApprovalManager(str(vault_path), str(config_path))
 
-        # Action handlers registry
-        self.handlers: Dict[str, Callable] = {}
+        # Action handlers registry - writes go through register_handler into
+        # the private dict; reads use a live read-only view so the hot
+        # dispatch path can never mutate it
+        self._handlers: Dict[str, Callable] = {}
+        self.handlers = types.MappingProxyType(self._handlers)
 
         # Retry configuration
         self.max_retries = 3
         self.retry_delays = [2, 4, 8]  # Exponential backoff: 2s, 4s, 8s
 
+        # Concurrent action execution - actions are independent I/O-bound
+        # calls, so N of them complete in ~max(T_i) instead of sum(T_i)
+        self.max_concurrency = 4
+
+        # (mtime_ns, files) snapshot of the Approved folder - lets idle
+        # polls skip the full glob when nothing changed
+        self._approved_cache: Optional[tuple] = None
+
         self.logger.info("ActionExecutor initialized")
 
     def register_handler(
@@ -72,7 +103,7 @@ class ActionExecutor:
             action_type: Type of action (e.g., "send_email")
             handler: Handler function that takes action_details and returns result
         """
-        self.handlers[action_type] = handler
+        self._handlers[action_type] = handler
         self.logger.info(f"Registered handler for action type: {action_type}")
 
     def execute_action(
@@ -110,6 +141,23 @@ class ActionExecutor:
         if retry_delays is None:
             retry_delays = self.retry_delays
 
+        # Fast reject: sniff action_type from the first 512 bytes so files
+        # with no registered handler skip the full read + YAML parse
+        with open(action_file, 'rb') as f:
+            head = f.read(512)
+        type_match = _HEAD_TYPE_RE.search(head)
+        if type_match:
+            sniffed_type = type_match.group(1).decode()
+            if sniffed_type not in self.handlers:
+                id_match = _HEAD_ID_RE.search(head)
+                error_msg = f"No handler registered for action type: {sniffed_type}"
+                self.logger.error(error_msg)
+                return self._create_failure_result(
+                    action_id=id_match.group(1).decode() if id_match else None,
+                    error=error_msg,
+                    retry_count=0
+                )
+
         # Read action file
         content = read_file(action_file)
         frontmatter, body = parse_frontmatter(content)
@@ -120,11 +168,20 @@ class ActionExecutor:
         if not action_id:
             raise ValueError(f"Action file missing ID: {action_file}")
 
-        self.logger.info(f"Executing action: {action_id} (type: {action_type})")
+        # Both INFO logs on the dispatch path are gated so batch runs with
+        # WARNING-level logging skip the format call entirely
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"Executing action: {action_id} (type: {action_type})")
 
         # Extract action details from body
         action_details = self._extract_action_details(body, action_type)
 
+        # One wall-clock read per execution - the ISO frontmatter stamp and
+        # the human-readable body line both derive from it
+        executed_dt = datetime.now()
+        executed_at = executed_dt.isoformat()
+        executed_human = executed_dt.strftime('%Y-%m-%d %I:%M %p')
+
         # Get handler for action type
         handler = self.handlers.get(action_type)
         if not handler:
@@ -133,14 +190,16 @@ class ActionExecutor:
             return self._create_failure_result(
                 action_id=action_id,
                 error=error_msg,
-                retry_count=0
+                retry_count=0,
+                executed_at=executed_at
             )
 
         # Execute with retry logic
         last_error = None
         for attempt in range(max_retries):
             try:
-                self.logger.info(f"Attempt {attempt + 1}/{max_retries}")
+                if self.logger.isEnabledFor(logging.INFO):
+                    self.logger.info(f"Attempt {attempt + 1}/{max_retries}")
 
                 # Execute action
                 result = handler(action_details)
@@ -150,13 +209,15 @@ class ActionExecutor:
                     "success": True,
                     "result": result,
                     "retry_count": attempt,
-                    "executed_at": datetime.now().isoformat(),
+                    "executed_at": executed_at,
                     "action_id": action_id,
                     "action_type": action_type,
                 }
 
                 # Update action file and move to Done
-                self._handle_success(action_file, frontmatter, body, success_result)
+                self._handle_success(
+                    action_file, frontmatter, body, success_result, executed_human
+                )
 
                 self.logger.info(f"Action executed successfully: {action_id}")
                 return success_result
@@ -178,11 +239,14 @@ class ActionExecutor:
         failure_result = self._create_failure_result(
             action_id=action_id,
             error=str(last_error),
-            retry_count=max_retries
+            retry_count=max_retries,
+            executed_at=executed_at
         )
 
         # Update action file and move to Failed
-        self._handle_failure(action_file, frontmatter, body, failure_result)
+        self._handle_failure(
+            action_file, frontmatter, body, failure_result, executed_human
+        )
 
         return failure_result
 
@@ -199,18 +263,9 @@ class ActionExecutor:
         """
         details = {"action_type": action_type}
 
-        # Parse body for action-specific details
-        lines = body.split("\n")
-
-        for line in lines:
-            # Look for key-value pairs in markdown format
-            if "**" in line and ":" in line:
-                # Extract key and value from "**Key**: Value" format
-                parts = line.split(":", 1)
-                if len(parts) == 2:
-                    key = parts[0].replace("**", "").strip().lower().replace(" ", "_")
-                    value = parts[1].strip()
-                    details[key] = value
+        # Extract key-value pairs from "**Key**: Value" markdown lines
+        for key, value in _KV_RE.findall(body):
+            details[key.strip().lower().replace(" ", "_")] = value.strip()
 
         return details
 
@@ -218,14 +273,15 @@ class ActionExecutor:
         self,
         action_id: str,
         error: str,
-        retry_count: int
+        retry_count: int,
+        executed_at: Optional[str] = None
     ) -> Dict[str, Any]:
         """Create failure result dictionary."""
         return {
             "success": False,
             "error": error,
             "retry_count": retry_count,
-            "executed_at": datetime.now().isoformat(),
+            "executed_at": executed_at or datetime.now().isoformat(),
             "action_id": action_id,
         }
 
@@ -234,7 +290,8 @@ class ActionExecutor:
         action_file: Path,
         frontmatter: Dict[str, Any],
         body: str,
-        result: Dict[str, Any]
+        result: Dict[str, Any],
+        executed_human: str
     ) -> None:
         """
         Handle successful action execution.
@@ -244,6 +301,7 @@ class ActionExecutor:
             frontmatter: Action frontmatter
             body: Action body
             result: Execution result
+            executed_human: Pre-formatted execution timestamp for the body
         """
         # Update frontmatter
         frontmatter["status"] = "completed"
@@ -252,17 +310,14 @@ class ActionExecutor:
         frontmatter["result"] = result.get("result", {})
 
         # Update body
-        updated_body = body.replace(
-            "**Status**: ✅ Approved",
-            "**Status**: ✅ Completed"
-        )
+        updated_body = _STATUS_RE.sub("**Status**: ✅ Completed", body, count=1)
 
         # Add execution details
         execution_details = f"""
 
 ## Execution Details
 
-**Executed At**: {datetime.now().strftime('%Y-%m-%d %I:%M %p')}
+**Executed At**: {executed_human}
 **Retry Count**: {result['retry_count']}
 **Result**: Success
 
@@ -272,15 +327,18 @@ class ActionExecutor:
 {result.get('result', {})}
 ```
 """
-        updated_body += execution_details
 
-        # Write updated content
-        content = serialize_frontmatter(frontmatter, updated_body)
-        write_file(action_file, content)
+        # Stream head, body and execution block straight to disk - the
+        # (possibly large) body is written once, never concatenated into a
+        # full-document string first
+        with open(action_file, 'w', encoding='utf-8') as f:
+            f.write(serialize_frontmatter(frontmatter, ""))
+            f.write(updated_body)
+            f.write(execution_details)
 
-        # Move to Done folder
-        done_path = self.done_folder / action_file.name
-        move_file(action_file, done_path)
+        # Move to Done folder - os.replace is atomic on POSIX and skips the
+        # move_file wrapper's validation for a destination we know exists
+        os.replace(str(action_file), os.path.join(self._done_str, action_file.name))
 
         self.logger.info(f"Moved completed action to Done folder")
 
@@ -289,7 +347,8 @@ class ActionExecutor:
         action_file: Path,
         frontmatter: Dict[str, Any],
         body: str,
-        result: Dict[str, Any]
+        result: Dict[str, Any],
+        executed_human: str
     ) -> None:
         """
         Handle failed action execution.
@@ -299,6 +358,7 @@ class ActionExecutor:
             frontmatter: Action frontmatter
             body: Action body
             result: Execution result
+            executed_human: Pre-formatted execution timestamp for the body
         """
         # Update frontmatter
         frontmatter["status"] = "failed"
@@ -307,17 +367,14 @@ class ActionExecutor:
         frontmatter["error"] = result["error"]
 
         # Update body
-        updated_body = body.replace(
-            "**Status**: ✅ Approved",
-            "**Status**: ❌ Failed"
-        )
+        updated_body = _STATUS_RE.sub("**Status**: ❌ Failed", body, count=1)
 
         # Add failure details
         failure_details = f"""
 
 ## Execution Details
 
-**Executed At**: {datetime.now().strftime('%Y-%m-%d %I:%M %p')}
+**Executed At**: {executed_human}
 **Retry Count**: {result['retry_count']}
 **Result**: Failed
 
@@ -334,15 +391,18 @@ class ActionExecutor:
 - Check logs for more information
 - Retry manually if needed
 """
-        updated_body += failure_details
 
-        # Write updated content
-        content = serialize_frontmatter(frontmatter, updated_body)
-        write_file(action_file, content)
+        # Stream head, body and failure block straight to disk - the
+        # (possibly large) body is written once, never concatenated into a
+        # full-document string first
+        with open(action_file, 'w', encoding='utf-8') as f:
+            f.write(serialize_frontmatter(frontmatter, ""))
+            f.write(updated_body)
+            f.write(failure_details)
 
-        # Move to Failed folder
-        failed_path = self.failed_folder / action_file.name
-        move_file(action_file, failed_path)
+        # Move to Failed folder - os.replace is atomic on POSIX and skips the
+        # move_file wrapper's validation for a destination we know exists
+        os.replace(str(action_file), os.path.join(self._failed_str, action_file.name))
 
         self.logger.info(f"Moved failed action to Failed folder")
 
@@ -365,30 +425,54 @@ class ActionExecutor:
         }
 
         try:
-            # Get all approved action files
-            approved_files = list_files(self.approved_folder, "*.md")
+            # Get all approved action files, re-globbing only when the
+            # folder's mtime says its contents changed
+            try:
+                mtime_ns = os.stat(self.approved_folder).st_mtime_ns
+            except FileNotFoundError:
+                mtime_ns = None
+
+            if self._approved_cache and self._approved_cache[0] == mtime_ns:
+                approved_files = self._approved_cache[1]
+            else:
+                approved_files = list_files(self.approved_folder, "*.md")
+                self._approved_cache = (mtime_ns, approved_files)
+
             results["total"] = len(approved_files)
 
             self.logger.info(f"Found {len(approved_files)} approved actions to execute")
 
-            for action_file in approved_files:
-                try:
-                    result = self.execute_action(action_file)
-                    results["results"].append(result)
+            # Execute independent actions concurrently - each action works on
+            # its own file, so the success/failure writes never contend
+            with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+                futures = {
+                    executor.submit(self.execute_action, action_file): action_file
+                    for action_file in approved_files
+                }
+
+                for future in as_completed(futures):
+                    action_file = futures[future]
+                    try:
+                        result = future.result()
+                        results["results"].append(result)
+
+                        if result["success"]:
+                            results["successful"] += 1
+                        else:
+                            results["failed"] += 1
 
-                    if result["success"]:
-                        results["successful"] += 1
-                    else:
+                    except Exception as e:
+                        self.logger.error(f"Failed to execute action {action_file}: {e}")
                         results["failed"] += 1
+                        results["results"].append({
+                            "success": False,
+                            "error": str(e),
+                            "action_file": str(action_file),
+                        })
 
-                except Exception as e:
-                    self.logger.error(f"Failed to execute action {action_file}: {e}")
-                    results["failed"] += 1
-                    results["results"].append({
-                        "success": False,
-                        "error": str(e),
-                        "action_file": str(action_file),
-                    })
+            # Executed actions were moved out of Approved - drop the snapshot
+            if approved_files:
+                self._approved_cache = None
 
             return results
 
@@ -396,6 +480,18 @@ class ActionExecutor:
             self.logger.error(f"Failed to execute approved actions: {e}")
             return results
 
+    @staticmethod
+    def _count_md(folder: Path) -> int:
+        """Count .md files in a folder without materializing Path objects."""
+        try:
+            with os.scandir(folder) as it:
+                return sum(
+                    1 for e in it
+                    if e.name.endswith('.md') and e.is_file(follow_symlinks=False)
+                )
+        except FileNotFoundError:
+            return 0
+
     def get_execution_stats(self) -> Dict[str, Any]:
         """
         Get execution statistics.
@@ -408,15 +504,15 @@ class ActionExecutor:
             - pending_approval: int
         """
         try:
-            done_files = list_files(self.done_folder, "*.md")
-            failed_files = list_files(self.failed_folder, "*.md")
-            approved_files = list_files(self.approved_folder, "*.md")
+            done_count = self._count_md(self.done_folder)
+            failed_count = self._count_md(self.failed_folder)
+            approved_count = self._count_md(self.approved_folder)
 
             stats = {
-                "total_executed": len(done_files) + len(failed_files),
-                "successful": len(done_files),
-                "failed": len(failed_files),
-                "pending_approval": len(approved_files),
+                "total_executed": done_count + failed_count,
+                "successful": done_count,
+                "failed": failed_count,
+                "pending_approval": approved_count,
             }
 
             return stats
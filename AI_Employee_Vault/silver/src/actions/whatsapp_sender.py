@@ -7,6 +7,7 @@ using Playwright browser automation.
 
 from pathlib import Path
 from typing import Dict, Any, Optional, List
+import atexit
 import os
 import logging
 import time
@@ -21,6 +22,32 @@ except ImportError:
     PLAYWRIGHT_AVAILABLE = False
 
 
+# WhatsApp Web DOM selectors. The markup churns with WhatsApp releases;
+# keeping every selector here means an update touches one block instead
+# of a hunt through the methods.
+_SEL_QR = 'canvas[aria-label="Scan me!"]'
+_SEL_CHAT_LIST = 'div[aria-label="Chat list"]'
+_SEL_SEARCH_BOX = 'div[contenteditable="true"][data-tab="3"]'
+_SEL_MSG_BOX = 'div[contenteditable="true"][data-tab="10"]'
+_SEL_DBLCHECK = 'span[data-icon="msg-dblcheck"]'
+_SEL_ANY_TICK = f'span[data-icon="msg-check"], {_SEL_DBLCHECK}'
+_SEL_CONTACT_TMPL = 'span[title="%s"]'
+
+# One Playwright node driver for the whole process. Starting it costs
+# ~200ms and ~50MB RSS, so it is shared across every sender instance and
+# stopped once at interpreter exit.
+_PW = None
+
+
+def _get_pw():
+    """Start the shared Playwright driver on first use."""
+    global _PW
+    if _PW is None:
+        _PW = sync_playwright().start()
+        atexit.register(_PW.stop)
+    return _PW
+
+
 class WhatsAppSender:
     """
     Sends WhatsApp messages via WhatsApp Web automation.
@@ -54,8 +81,62 @@ class WhatsAppSender:
         self.headless = os.getenv("WHATSAPP_HEADLESS", "true").lower() == "true"
         self.timeout = int(os.getenv("WHATSAPP_TIMEOUT", "30000"))  # 30 seconds
 
+        # Lazily-started browser shared across calls. Launching Chromium and
+        # syncing the WhatsApp chat list dominates per-message latency, so
+        # the first call pays it once and later calls reuse the session.
+        # The Playwright driver itself is the module-level _PW singleton.
+        self._browser = None
+        self._page = None
+
         self.logger.info("WhatsAppSender initialized")
 
+    def _ensure_browser(self):
+        """
+        Start the persistent browser context on first use and return its page.
+
+        Returns:
+            Playwright page object navigated to WhatsApp Web
+        """
+        if self._page is None:
+            self._browser = _get_pw().chromium.launch_persistent_context(
+                user_data_dir=str(self.session_path),
+                headless=self.headless,
+                args=[
+                    '--no-sandbox',
+                    '--disable-setuid-sandbox',
+                    '--disable-dev-shm-usage',
+                    '--disable-accelerated-2d-canvas',
+                    '--disable-gpu',
+                ]
+            )
+            self._page = (
+                self._browser.pages[0] if self._browser.pages
+                else self._browser.new_page()
+            )
+
+        # Navigate only when not already on WhatsApp Web
+        if self._page.url != 'https://web.whatsapp.com/':
+            self._page.goto('https://web.whatsapp.com', timeout=self.timeout)
+
+        return self._page
+
+    def close(self) -> None:
+        """Close this instance's browser; the shared driver stays up."""
+        if self._browser is not None:
+            try:
+                self._browser.close()
+            except Exception as e:
+                self.logger.warning(f"Failed to close browser: {e}")
+            self._browser = None
+            self._page = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
     def send_message(
         self,
         to: str,
@@ -88,51 +169,31 @@ class WhatsAppSender:
 
             self.logger.info(f"Sending WhatsApp message to: {to}")
 
-            # Launch browser and send message
-            with sync_playwright() as p:
-                # Launch persistent context (maintains login session)
-                browser = p.chromium.launch_persistent_context(
-                    user_data_dir=str(self.session_path),
-                    headless=self.headless,
-                    args=[
-                        '--no-sandbox',
-                        '--disable-setuid-sandbox',
-                        '--disable-dev-shm-usage',
-                        '--disable-accelerated-2d-canvas',
-                        '--disable-gpu',
-                    ]
-                )
-
-                page = browser.pages[0] if browser.pages else browser.new_page()
+            # Reuse the shared browser (launched on first call)
+            page = self._ensure_browser()
 
-                # Navigate to WhatsApp Web
-                page.goto('https://web.whatsapp.com', timeout=self.timeout)
+            # Wait for WhatsApp to load
+            self._wait_for_whatsapp_ready(page)
 
-                # Wait for WhatsApp to load
-                self._wait_for_whatsapp_ready(page)
+            # Search for contact
+            self._search_contact(page, to)
 
-                # Search for contact
-                self._search_contact(page, to)
+            # Send message
+            self._send_message_text(page, message)
 
-                # Send message
-                self._send_message_text(page, message)
+            # Wait for delivery if requested
+            if wait_for_delivery:
+                delivered = self._wait_for_delivery(page)
+                if not delivered:
+                    self.logger.warning("Could not confirm message delivery")
 
-                # Wait for delivery if requested
-                if wait_for_delivery:
-                    delivered = self._wait_for_delivery(page)
-                    if not delivered:
-                        self.logger.warning("Could not confirm message delivery")
+            self.logger.info(f"WhatsApp message sent successfully to: {to}")
 
-                # Close browser
-                browser.close()
-
-                self.logger.info(f"WhatsApp message sent successfully to: {to}")
-
-                return {
-                    "success": True,
-                    "message_id": f"whatsapp_{int(time.time())}",
-                    "recipient": to,
-                }
+            return {
+                "success": True,
+                "message_id": f"whatsapp_{int(time.time())}",
+                "recipient": to,
+            }
 
         except PlaywrightTimeout as e:
             error_msg = f"WhatsApp Web timeout: {str(e)}"
@@ -162,7 +223,7 @@ class WhatsAppSender:
         """
         try:
             # Check if QR code is present (not logged in)
-            qr_code = page.locator('canvas[aria-label="Scan me!"]')
+            qr_code = page.locator(_SEL_QR)
             if qr_code.is_visible(timeout=5000):
                 self.logger.error(
                     "WhatsApp Web not logged in. Please scan QR code. "
@@ -171,7 +232,7 @@ class WhatsAppSender:
                 raise ValueError("WhatsApp Web not logged in")
 
             # Wait for chat list to load (logged in)
-            page.wait_for_selector('div[aria-label="Chat list"]', timeout=self.timeout)
+            page.wait_for_selector(_SEL_CHAT_LIST, timeout=self.timeout)
             self.logger.info("WhatsApp Web loaded successfully")
 
         except Exception as e:
@@ -191,21 +252,23 @@ class WhatsAppSender:
         """
         try:
             # Click search box
-            search_box = page.locator('div[contenteditable="true"][data-tab="3"]')
+            search_box = page.locator(_SEL_SEARCH_BOX)
             search_box.click()
-            time.sleep(0.5)
 
             # Type contact name/number
             search_box.fill(contact)
-            time.sleep(1)
 
-            # Click on first result
-            first_result = page.locator(f'span[title="{contact}"]').first
-            if not first_result.is_visible(timeout=5000):
+            # Wait for the matching result instead of sleeping a fixed second
+            first_result = page.locator(_SEL_CONTACT_TMPL % contact).first
+            try:
+                first_result.wait_for(state='visible', timeout=5000)
+            except PlaywrightTimeout:
                 raise ValueError(f"Contact not found: {contact}")
 
             first_result.click()
-            time.sleep(0.5)
+
+            # Chat is open once the message composer appears
+            page.wait_for_selector(_SEL_MSG_BOX, timeout=5000)
 
             self.logger.info(f"Contact found and selected: {contact}")
 
@@ -226,17 +289,18 @@ class WhatsAppSender:
         """
         try:
             # Find message input box
-            message_box = page.locator('div[contenteditable="true"][data-tab="10"]')
-            if not message_box.is_visible(timeout=5000):
+            message_box = page.locator(_SEL_MSG_BOX)
+            try:
+                message_box.wait_for(state='visible', timeout=5000)
+            except PlaywrightTimeout:
                 raise ValueError("Message input box not found")
 
-            # Type message
+            # Type message and press Enter to send
             message_box.fill(message)
-            time.sleep(0.5)
-
-            # Press Enter to send
             message_box.press('Enter')
-            time.sleep(0.5)
+
+            # The outgoing message shows a tick as soon as WhatsApp accepts it
+            page.wait_for_selector(_SEL_ANY_TICK, timeout=self.timeout)
 
             self.logger.info("Message sent")
 
@@ -256,19 +320,21 @@ class WhatsAppSender:
             True if delivery confirmed, False otherwise
         """
         try:
-            # Wait for double checkmark (delivered)
-            # WhatsApp uses different icons for sent/delivered/read
-            # This is a simplified check
-            time.sleep(2)  # Give time for delivery
-
-            # Check for checkmarks in last message
-            checkmarks = page.locator('span[data-icon="msg-dblcheck"]')
-            if checkmarks.count() > 0:
+            # Wait for the double checkmark (delivered). The predicate runs
+            # inside the page and resolves on the DOM mutation itself, so
+            # this is one protocol round-trip instead of locator polling,
+            # and the pessimistic path waits the full timeout rather than
+            # returning a premature False.
+            try:
+                page.wait_for_function(
+                    f"document.querySelector('{_SEL_DBLCHECK}') !== null",
+                    timeout=timeout * 1000
+                )
                 self.logger.info("Message delivery confirmed")
                 return True
-
-            self.logger.warning("Could not confirm delivery")
-            return False
+            except PlaywrightTimeout:
+                self.logger.warning("Could not confirm delivery")
+                return False
 
         except Exception as e:
             self.logger.warning(f"Failed to check delivery status: {e}")
@@ -282,22 +348,11 @@ class WhatsAppSender:
             True if session is active, False otherwise
         """
         try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch_persistent_context(
-                    user_data_dir=str(self.session_path),
-                    headless=True,
-                )
-
-                page = browser.pages[0] if browser.pages else browser.new_page()
-                page.goto('https://web.whatsapp.com', timeout=self.timeout)
-
-                # Check if logged in
-                qr_code = page.locator('canvas[aria-label="Scan me!"]')
-                is_logged_in = not qr_code.is_visible(timeout=5000)
+            page = self._ensure_browser()
 
-                browser.close()
-
-                return is_logged_in
+            # Check if logged in
+            qr_code = page.locator(_SEL_QR)
+            return not qr_code.is_visible(timeout=5000)
 
         except Exception as e:
             self.logger.error(f"Failed to verify session: {e}")
@@ -315,39 +370,24 @@ class WhatsAppSender:
             List of message dictionaries
         """
         try:
-            messages = []
-
-            with sync_playwright() as p:
-                browser = p.chromium.launch_persistent_context(
-                    user_data_dir=str(self.session_path),
-                    headless=True,
-                )
-
-                page = browser.pages[0] if browser.pages else browser.new_page()
-                page.goto('https://web.whatsapp.com', timeout=self.timeout)
-
-                # Wait for WhatsApp to load
-                self._wait_for_whatsapp_ready(page)
-
-                # Search for contact
-                self._search_contact(page, contact)
+            page = self._ensure_browser()
 
-                # Get messages
-                message_elements = page.locator('div[class*="message"]').all()[:limit]
+            # Wait for WhatsApp to load
+            self._wait_for_whatsapp_ready(page)
 
-                for elem in message_elements:
-                    try:
-                        text = elem.inner_text()
-                        messages.append({
-                            'text': text,
-                            'contact': contact,
-                        })
-                    except:
-                        continue
+            # Search for contact
+            self._search_contact(page, contact)
 
-                browser.close()
+            # Collect all message texts in one in-page call; per-element
+            # inner_text() would cost a protocol round-trip each
+            texts = page.evaluate(
+                "(limit) => Array.from("
+                "document.querySelectorAll('div[class*=\"message\"]')"
+                ").slice(0, limit).map(e => e.innerText)",
+                limit
+            )
 
-            return messages
+            return [{'text': text, 'contact': contact} for text in texts]
 
         except Exception as e:
             self.logger.error(f"Failed to get recent messages: {e}")
@@ -366,52 +406,58 @@ def main():
     vault_path = "/mnt/d/hamza/autonomous-ftes/AI_Employee_Vault"
 
     try:
-        # Initialize sender
-        sender = WhatsAppSender(vault_path)
-
-        # Verify session
-        print("Verifying WhatsApp Web session...")
-        is_logged_in = sender.verify_session()
-
-        if not is_logged_in:
-            print("❌ WhatsApp Web not logged in")
-            print("   Run: python silver/scripts/setup_whatsapp.py")
-            sys.exit(1)
-
-        print("✅ WhatsApp Web session active")
-
-        # Test: Send test message
-        print("\nSending test message...")
-        print("Note: This will send a real WhatsApp message!")
-        print()
-
-        # Get recipient from user
-        to = input("Enter recipient name or phone number: ").strip()
-        if not to:
-            print("❌ No recipient provided")
-            sys.exit(1)
-
-        # Send test message
-        result = sender.send_message(
-            to=to,
-            message="Test message from AI Employee Vault Silver tier. "
-                   "If you received this, WhatsApp sending is working correctly!",
-            wait_for_delivery=True
-        )
-
-        if result['success']:
-            print(f"\n✅ Message sent successfully!")
-            print(f"   Message ID: {result['message_id']}")
-            print(f"   Recipient: {result['recipient']}")
-        else:
-            print(f"\n❌ Failed to send message: {result['error']}")
-
-        sys.exit(0 if result['success'] else 1)
+        # Initialize sender (context manager closes the shared browser)
+        with WhatsAppSender(vault_path) as sender:
+            _run_test(sender)
 
     except Exception as e:
         print(f"❌ Error: {e}", file=sys.stderr)
         sys.exit(1)
 
 
+def _run_test(sender: "WhatsAppSender") -> None:
+    """Run the interactive send test against an initialized sender."""
+    import sys
+
+    # Verify session
+    print("Verifying WhatsApp Web session...")
+    is_logged_in = sender.verify_session()
+
+    if not is_logged_in:
+        print("❌ WhatsApp Web not logged in")
+        print("   Run: python silver/scripts/setup_whatsapp.py")
+        sys.exit(1)
+
+    print("✅ WhatsApp Web session active")
+
+    # Test: Send test message
+    print("\nSending test message...")
+    print("Note: This will send a real WhatsApp message!")
+    print()
+
+    # Get recipient from user
+    to = input("Enter recipient name or phone number: ").strip()
+    if not to:
+        print("❌ No recipient provided")
+        sys.exit(1)
+
+    # Send test message
+    result = sender.send_message(
+        to=to,
+        message="Test message from AI Employee Vault Silver tier. "
+               "If you received this, WhatsApp sending is working correctly!",
+        wait_for_delivery=True
+    )
+
+    if result['success']:
+        print(f"\n✅ Message sent successfully!")
+        print(f"   Message ID: {result['message_id']}")
+        print(f"   Recipient: {result['recipient']}")
+    else:
+        print(f"\n❌ Failed to send message: {result['error']}")
+
+    sys.exit(0 if result['success'] else 1)
+
+
 if __name__ == "__main__":
     main()
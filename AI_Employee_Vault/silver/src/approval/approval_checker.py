@@ -5,10 +5,13 @@ This module polls the Pending_Approval folder for status changes
 and moves files to Approved or Rejected folders accordingly.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 from datetime import datetime
-import time
+import asyncio
+import os
+import re
 import logging
 
 from ..utils import (
@@ -16,12 +19,32 @@ from ..utils import (
     load_yaml_file,
     parse_frontmatter,
     update_frontmatter_field,
+    read_frontmatter_only,
     read_file,
-    write_file,
-    move_file,
-    list_files,
+    serialize_frontmatter,
 )
 
+# Status line stamped by ApprovalManager; the handlers rewrite it in
+# place. The anchored pattern lets the regex engine try only line starts
+# instead of substring-scanning the whole body for the literal.
+_STATUS_LINE_RE = re.compile(r'^\*\*Status\*\*:.*$', re.MULTILINE)
+
+# watchfiles (Rust-backed inotify/FSEvents) powers the event-driven run
+# loop; without it the checker falls back to interval polling
+try:
+    from watchfiles import awatch, Change
+    WATCHFILES_AVAILABLE = True
+except ImportError:
+    WATCHFILES_AVAILABLE = False
+
+# aiofiles lets per-file reads/writes overlap on one thread; without it
+# file I/O is pushed to the default thread pool instead
+try:
+    import aiofiles
+    AIOFILES_AVAILABLE = True
+except ImportError:
+    AIOFILES_AVAILABLE = False
+
 
 class ApprovalChecker:
     """
@@ -55,12 +78,32 @@ class ApprovalChecker:
         # Polling interval
         self.poll_interval = self.config["workflow"]["poll_interval"]
 
+        # Last-seen mtime per pending file, so a poll re-parses only files
+        # that actually changed; timeout deadlines recorded from earlier
+        # parses let unmodified files still expire on schedule
+        self._mtime_cache: Dict[str, float] = {}
+        self._timeout_deadlines: Dict[str, float] = {}
+
+        # Dedicated pool for the blocking file work behind the async
+        # checks, sized for I/O-bound fan-out so a large poll doesn't
+        # queue behind other users of the default executor
+        self._pool = ThreadPoolExecutor(
+            max_workers=min(32, (os.cpu_count() or 1) * 4)
+        )
+
         self.logger.info("ApprovalChecker initialized")
 
-    def poll_for_approvals(self) -> List[Dict[str, Any]]:
+    def close(self) -> None:
+        """Shut down the checker's worker pool."""
+        self._pool.shutdown(wait=False)
+
+    async def poll_for_approvals(self) -> List[Dict[str, Any]]:
         """
         Poll Pending_Approval folder for status changes.
 
+        Per-file checks run concurrently, so a poll over N files costs
+        roughly one file-I/O latency instead of N.
+
         Returns:
             List of approval status dictionaries with:
             - request_id: str
@@ -70,25 +113,83 @@ class ApprovalChecker:
         approvals = []
 
         try:
-            # Get all pending approval files
-            pending_files = list_files(self.pending_folder, "*.md")
-            self.logger.debug(f"Found {len(pending_files)} pending approval files")
-
-            for file_path in pending_files:
-                try:
-                    status = self.check_approval_status(file_path)
-                    if status["status"] != "pending":
-                        approvals.append(status)
-                except Exception as e:
-                    self.logger.error(f"Failed to check approval status for {file_path}: {e}")
+            # Re-check only files whose mtime advanced or timeout came due
+            pending_files = self._changed_pending_files()
+            self.logger.debug("Found %d changed approval files", len(pending_files))
+
+            results = await asyncio.gather(
+                *(self.check_approval_status(p) for p in pending_files),
+                return_exceptions=True,
+            )
+
+            for file_path, result in zip(pending_files, results):
+                if isinstance(result, Exception):
+                    self.logger.error("Failed to check approval status for %s: %s", file_path, result)
+                elif result["status"] != "pending":
+                    approvals.append(result)
+                elif result.get("timeout_at"):
+                    # Remember when this still-pending file expires so an
+                    # unmodified file is re-checked once its deadline passes
+                    try:
+                        self._timeout_deadlines[str(file_path)] = (
+                            datetime.fromisoformat(result["timeout_at"]).timestamp()
+                        )
+                    except ValueError:
+                        pass
+
+            # One directory fsync per batch makes the whole group of
+            # renames durable together, instead of paying a disk flush
+            # for every file moved out of Pending_Approval
+            if approvals:
+                loop = asyncio.get_running_loop()
+                for folder in {Path(a["file_path"]).parent for a in approvals}:
+                    await loop.run_in_executor(self._pool, self._fsync_dir, folder)
 
             return approvals
 
         except Exception as e:
-            self.logger.error(f"Failed to poll for approvals: {e}")
+            self.logger.error("Failed to poll for approvals: %s", e)
             return []
 
-    def check_approval_status(self, file_path: Path) -> Dict[str, Any]:
+    def _changed_pending_files(self) -> List[Path]:
+        """
+        Scan the pending folder and return files worth re-parsing.
+
+        A file qualifies when its mtime advanced past the last poll or a
+        previously recorded timeout deadline has passed. Everything else
+        costs one stat from the scandir entry and no open/parse.
+
+        Returns:
+            List of changed pending file paths
+        """
+        changed = []
+        seen = set()
+        now = datetime.now().timestamp()
+
+        try:
+            entries = os.scandir(self.pending_folder)
+        except FileNotFoundError:
+            return []
+
+        with entries:
+            for entry in entries:
+                if not entry.name.endswith('.md'):
+                    continue
+                seen.add(entry.path)
+                stat = entry.stat()
+                due = now >= self._timeout_deadlines.get(entry.path, float('inf'))
+                if stat.st_mtime > self._mtime_cache.get(entry.path, 0.0) or due:
+                    changed.append(Path(entry.path))
+                    self._mtime_cache[entry.path] = stat.st_mtime
+
+        # Forget files that left the pending folder
+        for stale in set(self._mtime_cache) - seen:
+            self._mtime_cache.pop(stale, None)
+            self._timeout_deadlines.pop(stale, None)
+
+        return changed
+
+    async def check_approval_status(self, file_path: Path) -> Dict[str, Any]:
         """
         Check approval status of a single file.
 
@@ -104,47 +205,106 @@ class ApprovalChecker:
             - updated_at: str (ISO timestamp)
         """
         try:
-            # Read file
-            content = read_file(file_path)
-            frontmatter, body = parse_frontmatter(content)
+            # Peek at just the frontmatter first - for the common case
+            # (still pending) the body is never read or parsed
+            head = await asyncio.get_running_loop().run_in_executor(
+                self._pool, read_frontmatter_only, str(file_path)
+            )
+
+            request_id = head.get("id")
+            status = head.get("status", "pending")
+            timeout_at = head.get("timeout_at")
 
-            request_id = frontmatter.get("id")
-            status = frontmatter.get("status", "pending")
-            timeout_at = frontmatter.get("timeout_at")
+            # One clock read per check; handlers reuse it for every stamp
+            now = datetime.now()
+            now_iso = now.isoformat()
 
-            # Check for timeout
+            timed_out = False
+            timeout_dt = None
             if status == "pending" and timeout_at:
                 timeout_dt = datetime.fromisoformat(timeout_at)
-                if datetime.now() > timeout_dt:
-                    self.logger.info(f"Approval request {request_id} timed out")
-                    return self._handle_timeout(file_path, frontmatter, body)
+                timed_out = now > timeout_dt
+
+            if status in ("approved", "rejected") or timed_out:
+                # State transition: now read the whole file so the
+                # handlers can rewrite and move it
+                if AIOFILES_AVAILABLE:
+                    async with aiofiles.open(file_path, 'r', encoding='utf-8') as f:
+                        content = await f.read()
+                else:
+                    content = await asyncio.to_thread(read_file, file_path)
+                frontmatter, body = parse_frontmatter(content)
+
+                if timed_out:
+                    self.logger.info("Approval request %s timed out", request_id)
+                    return await self._handle_timeout(
+                        file_path, frontmatter, body, now_iso, timeout_dt
+                    )
 
-            # Check for status change
-            if status == "approved":
-                self.logger.info(f"Approval request {request_id} approved")
-                return self._handle_approved(file_path, frontmatter, body)
+                if status == "approved":
+                    self.logger.info("Approval request %s approved", request_id)
+                    return await self._handle_approved(file_path, frontmatter, body, now_iso)
 
-            elif status == "rejected":
-                self.logger.info(f"Approval request {request_id} rejected")
-                return self._handle_rejected(file_path, frontmatter, body)
+                self.logger.info("Approval request %s rejected", request_id)
+                return await self._handle_rejected(file_path, frontmatter, body, now_iso)
 
             # Still pending
             return {
                 "request_id": request_id,
                 "status": "pending",
                 "file_path": file_path,
-                "updated_at": datetime.now().isoformat()
+                "timeout_at": timeout_at,
+                "updated_at": now_iso
             }
 
         except Exception as e:
-            self.logger.error(f"Failed to check approval status for {file_path}: {e}")
+            self.logger.error("Failed to check approval status for %s: %s", file_path, e)
             raise
 
-    def _handle_approved(
+    @staticmethod
+    def _replace_into(content: str, src: Path, dest: Path) -> None:
+        """
+        Write updated content straight into the destination folder.
+
+        Writes to a temp file beside dest, renames it into place with
+        os.replace (atomic on the same filesystem) and unlinks the
+        original - one write plus one rename instead of rewriting the
+        source file and then moving it across directories.
+
+        Args:
+            content: Full file content
+            src: Original pending-file path to remove
+            dest: Final path in the destination folder
+        """
+        tmp = dest.with_suffix('.md.tmp')
+        with open(tmp, 'wb') as f:
+            f.write(content.encode('utf-8'))
+        os.replace(tmp, dest)
+        src.unlink(missing_ok=True)
+
+    @staticmethod
+    def _fsync_dir(path: Path) -> None:
+        """
+        Flush a directory's entries so completed renames survive a crash.
+
+        Called once per destination folder per poll batch rather than
+        once per file.
+
+        Args:
+            path: Directory whose entries should be flushed
+        """
+        fd = os.open(path, os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0))
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    async def _handle_approved(
         self,
         file_path: Path,
         frontmatter: Dict[str, Any],
-        body: str
+        body: str,
+        now_iso: str
     ) -> Dict[str, Any]:
         """
         Handle approved approval request.
@@ -153,6 +313,7 @@ class ApprovalChecker:
             file_path: Path to approval request file
             frontmatter: Frontmatter dictionary
             body: Body content
+            now_iso: ISO timestamp computed by the caller
 
         Returns:
             Status dictionary
@@ -160,38 +321,36 @@ class ApprovalChecker:
         request_id = frontmatter["id"]
 
         # Update frontmatter
-        frontmatter["approved_at"] = datetime.now().isoformat()
+        frontmatter["approved_at"] = now_iso
 
         # Update body
-        updated_body = body.replace(
-            "**Status**: ⏳ Pending Approval",
-            "**Status**: ✅ Approved"
-        )
+        updated_body = _STATUS_LINE_RE.sub("**Status**: ✅ Approved", body, count=1)
 
         # Write updated content
-        from ..utils import serialize_frontmatter
         content = serialize_frontmatter(frontmatter, updated_body)
-        write_file(file_path, content)
 
-        # Move to Approved folder
+        # Write updated content directly into the Approved folder
         approved_path = self.approved_folder / file_path.name
-        move_file(file_path, approved_path)
+        await asyncio.get_running_loop().run_in_executor(
+            self._pool, self._replace_into, content, file_path, approved_path
+        )
 
-        self.logger.info(f"Moved {request_id} to Approved folder")
+        self.logger.info("Moved %s to Approved folder", request_id)
 
         return {
             "request_id": request_id,
             "status": "approved",
             "file_path": approved_path,
             "approved_at": frontmatter["approved_at"],
-            "updated_at": datetime.now().isoformat()
+            "updated_at": now_iso
         }
 
-    def _handle_rejected(
+    async def _handle_rejected(
         self,
         file_path: Path,
         frontmatter: Dict[str, Any],
-        body: str
+        body: str,
+        now_iso: str
     ) -> Dict[str, Any]:
         """
         Handle rejected approval request.
@@ -200,6 +359,7 @@ class ApprovalChecker:
             file_path: Path to approval request file
             frontmatter: Frontmatter dictionary
             body: Body content
+            now_iso: ISO timestamp computed by the caller
 
         Returns:
             Status dictionary
@@ -208,24 +368,24 @@ class ApprovalChecker:
         reason = frontmatter.get("rejection_reason", "No reason provided")
 
         # Update frontmatter
-        frontmatter["rejected_at"] = datetime.now().isoformat()
+        frontmatter["rejected_at"] = now_iso
 
-        # Update body
-        updated_body = body.replace(
-            "**Status**: ⏳ Pending Approval",
-            f"**Status**: ❌ Rejected\n\n**Reason**: {reason}"
+        # Update body (lambda replacement so reason text is taken verbatim)
+        updated_body = _STATUS_LINE_RE.sub(
+            lambda _: f"**Status**: ❌ Rejected\n\n**Reason**: {reason}",
+            body, count=1
         )
 
         # Write updated content
-        from ..utils import serialize_frontmatter
         content = serialize_frontmatter(frontmatter, updated_body)
-        write_file(file_path, content)
 
-        # Move to Rejected folder
+        # Write updated content directly into the Rejected folder
         rejected_path = self.rejected_folder / file_path.name
-        move_file(file_path, rejected_path)
+        await asyncio.get_running_loop().run_in_executor(
+            self._pool, self._replace_into, content, file_path, rejected_path
+        )
 
-        self.logger.info(f"Moved {request_id} to Rejected folder")
+        self.logger.info("Moved %s to Rejected folder", request_id)
 
         return {
             "request_id": request_id,
@@ -233,14 +393,16 @@ class ApprovalChecker:
             "file_path": rejected_path,
             "reason": reason,
             "rejected_at": frontmatter["rejected_at"],
-            "updated_at": datetime.now().isoformat()
+            "updated_at": now_iso
         }
 
-    def _handle_timeout(
+    async def _handle_timeout(
         self,
         file_path: Path,
         frontmatter: Dict[str, Any],
-        body: str
+        body: str,
+        now_iso: str,
+        timeout_dt: datetime
     ) -> Dict[str, Any]:
         """
         Handle timed out approval request.
@@ -249,37 +411,44 @@ class ApprovalChecker:
             file_path: Path to approval request file
             frontmatter: Frontmatter dictionary
             body: Body content
+            now_iso: ISO timestamp computed by the caller
+            timeout_dt: Already-parsed timeout_at datetime
 
         Returns:
             Status dictionary
         """
         request_id = frontmatter["id"]
-        timeout_minutes = self.config["workflow"]["timeout_behavior"]
+        timeout_behavior = self.config["workflow"]["timeout_behavior"]
 
         # Update frontmatter
         frontmatter["status"] = "rejected"
-        frontmatter["rejected_at"] = datetime.now().isoformat()
-        frontmatter["rejection_reason"] = timeout_minutes["reason"].format(
-            timeout_minutes=int((datetime.fromisoformat(frontmatter["timeout_at"]) -
-                               datetime.fromisoformat(frontmatter["created_at"])).total_seconds() / 60)
+        frontmatter["rejected_at"] = now_iso
+        # timeout_minutes is stamped at creation; the subtraction only
+        # remains for requests written before that field existed
+        timeout_minutes = frontmatter.get("timeout_minutes") or int(
+            (timeout_dt -
+             datetime.fromisoformat(frontmatter["created_at"])).total_seconds() / 60
+        )
+        frontmatter["rejection_reason"] = timeout_behavior["reason"].format(
+            timeout_minutes=timeout_minutes
         )
 
-        # Update body
-        updated_body = body.replace(
-            "**Status**: ⏳ Pending Approval",
-            f"**Status**: ⏱️ Timeout\n\n**Reason**: {frontmatter['rejection_reason']}"
+        # Update body (lambda replacement so reason text is taken verbatim)
+        updated_body = _STATUS_LINE_RE.sub(
+            lambda _: f"**Status**: ⏱️ Timeout\n\n**Reason**: {frontmatter['rejection_reason']}",
+            body, count=1
         )
 
         # Write updated content
-        from ..utils import serialize_frontmatter
         content = serialize_frontmatter(frontmatter, updated_body)
-        write_file(file_path, content)
 
-        # Move to Rejected folder
+        # Write updated content directly into the Rejected folder
         rejected_path = self.rejected_folder / file_path.name
-        move_file(file_path, rejected_path)
+        await asyncio.get_running_loop().run_in_executor(
+            self._pool, self._replace_into, content, file_path, rejected_path
+        )
 
-        self.logger.info(f"Moved {request_id} to Rejected folder (timeout)")
+        self.logger.info("Moved %s to Rejected folder (timeout)", request_id)
 
         return {
             "request_id": request_id,
@@ -287,16 +456,45 @@ class ApprovalChecker:
             "file_path": rejected_path,
             "reason": frontmatter["rejection_reason"],
             "rejected_at": frontmatter["rejected_at"],
-            "updated_at": datetime.now().isoformat()
+            "updated_at": now_iso
         }
 
-    def run(self) -> None:
+    def _process_approval(self, executor, approval: Dict[str, Any]) -> None:
         """
-        Main polling loop - continuously check for approval status changes.
+        Log one processed approval and execute it if approved.
 
-        This method runs indefinitely, checking for approvals every N seconds.
+        Args:
+            executor: ActionExecutor instance
+            approval: Status dictionary from check_approval_status
         """
-        self.logger.info(f"Starting approval checker (poll interval: {self.poll_interval}s)")
+        self.logger.info(
+            "Processed approval: %s → %s", approval['request_id'], approval['status']
+        )
+
+        if approval['status'] == 'approved':
+            try:
+                self.logger.info("Executing approved action: %s", approval['request_id'])
+                result = executor.execute_action(approval['file_path'])
+
+                if result['success']:
+                    self.logger.info("✅ Action executed successfully: %s", approval['request_id'])
+                else:
+                    self.logger.error("❌ Action execution failed: %s - %s", approval['request_id'], result.get('error'))
+
+            except Exception as e:
+                self.logger.error("Failed to execute action %s: %s", approval['request_id'], e)
+
+    async def run(self) -> None:
+        """
+        Main loop - react to approval status changes until cancelled.
+
+        With watchfiles installed the kernel delivers one event per real
+        change to the pending folder, so idle cost is ~zero and reaction
+        latency is milliseconds; a companion task still wakes every
+        poll_interval to catch timeout_at expiries, which produce no file
+        event. Without watchfiles the loop degrades to interval polling.
+        """
+        self.logger.info("Starting approval checker (poll interval: %ss)", self.poll_interval)
 
         # Import ActionExecutor for executing approved actions
         from ..actions.action_executor import ActionExecutor
@@ -308,38 +506,101 @@ class ApprovalChecker:
         self._register_action_handlers(executor)
 
         try:
-            while True:
-                # Poll for approvals
-                approvals = self.poll_for_approvals()
-
-                # Process each approval
-                for approval in approvals:
-                    self.logger.info(
-                        f"Processed approval: {approval['request_id']} → {approval['status']}"
-                    )
+            if WATCHFILES_AVAILABLE:
+                await self._run_watcher(executor)
+            else:
+                self.logger.warning(
+                    "watchfiles not installed - falling back to interval polling. "
+                    "Install with: pip install watchfiles"
+                )
+                await self._run_polling(executor)
 
-                    # Execute approved actions
-                    if approval['status'] == 'approved':
-                        try:
-                            self.logger.info(f"Executing approved action: {approval['request_id']}")
-                            result = executor.execute_action(approval['file_path'])
+        except (KeyboardInterrupt, asyncio.CancelledError):
+            self.logger.info("Approval checker stopped by user")
+        except Exception as e:
+            self.logger.error("Approval checker error: %s", e)
+            raise
 
-                            if result['success']:
-                                self.logger.info(f"✅ Action executed successfully: {approval['request_id']}")
-                            else:
-                                self.logger.error(f"❌ Action execution failed: {approval['request_id']} - {result.get('error')}")
+    async def _run_watcher(self, executor) -> None:
+        """
+        Event-driven loop: re-check only files the kernel reports changed.
 
-                        except Exception as e:
-                            self.logger.error(f"Failed to execute action {approval['request_id']}: {e}")
+        Args:
+            executor: ActionExecutor instance
+        """
+        timeout_task = asyncio.create_task(self._timeout_loop(executor))
 
-                # Sleep until next poll
-                time.sleep(self.poll_interval)
+        try:
+            # force_polling mirrors watchfiles' escape hatch for filesystems
+            # without change notification (e.g. some network mounts)
+            async for changes in awatch(
+                self.pending_folder,
+                force_polling=os.getenv("WATCHFILES_FORCE_POLLING") == "1",
+            ):
+                for change, path in changes:
+                    if change == Change.deleted or not path.endswith(".md"):
+                        continue
+                    try:
+                        status = await self.check_approval_status(Path(path))
+                        if status["status"] != "pending":
+                            self._process_approval(executor, status)
+                    except FileNotFoundError:
+                        # Raced with a move; the event is stale
+                        continue
+                    except Exception as e:
+                        self.logger.error("Failed to check approval status for %s: %s", path, e)
+        finally:
+            timeout_task.cancel()
+
+    def _idle_backoff(self, idle_ticks: int) -> float:
+        """
+        Compute the sleep before the next sweep from consecutive idle ticks.
 
-        except KeyboardInterrupt:
-            self.logger.info("Approval checker stopped by user")
-        except Exception as e:
-            self.logger.error(f"Approval checker error: {e}")
-            raise
+        Doubles the base poll interval per empty sweep, capped at 16x, so
+        a quiet folder costs far fewer wakeups while any activity snaps
+        the cadence back to poll_interval.
+
+        Args:
+            idle_ticks: Number of consecutive sweeps that found nothing
+
+        Returns:
+            Sleep duration in seconds
+        """
+        return min(
+            self.poll_interval * 2 ** min(idle_ticks, 4),
+            self.poll_interval * 16,
+        )
+
+    async def _timeout_loop(self, executor) -> None:
+        """
+        Periodic sweep for timeout_at expiries, which emit no file event.
+
+        Args:
+            executor: ActionExecutor instance
+        """
+        idle_ticks = 0
+        while True:
+            await asyncio.sleep(self._idle_backoff(idle_ticks))
+            approvals = await self.poll_for_approvals()
+            idle_ticks = 0 if approvals else idle_ticks + 1
+            for approval in approvals:
+                self._process_approval(executor, approval)
+
+    async def _run_polling(self, executor) -> None:
+        """
+        Fallback interval-polling loop used when watchfiles is missing.
+
+        Args:
+            executor: ActionExecutor instance
+        """
+        idle_ticks = 0
+        while True:
+            approvals = await self.poll_for_approvals()
+            idle_ticks = 0 if approvals else idle_ticks + 1
+            for approval in approvals:
+                self._process_approval(executor, approval)
+
+            await asyncio.sleep(self._idle_backoff(idle_ticks))
 
     def _register_action_handlers(self, executor) -> None:
         """
@@ -421,8 +682,8 @@ def main():
         # Initialize checker
         checker = ApprovalChecker(vault_path, config_path)
 
-        # Run polling loop
-        checker.run()
+        # Run event loop
+        asyncio.run(checker.run())
 
         sys.exit(0)
 
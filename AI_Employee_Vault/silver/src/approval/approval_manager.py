@@ -6,10 +6,15 @@ and execution of approved actions with retry logic.
 """
 
 from pathlib import Path
+from string import Template
 from typing import Dict, Any, Optional
 from datetime import datetime, timedelta
-import time
+import asyncio
+import functools
+import itertools
 import logging
+import random
+import time
 
 from ..utils import (
     get_logger,
@@ -21,6 +26,49 @@ from ..utils import (
 )
 
 
+@functools.lru_cache(maxsize=256)
+def _title_key(key: str) -> str:
+    """Format a snake_case key for display, caching repeated keys."""
+    return key.replace("_", " ").title()
+
+
+# Built once at import time instead of re-parsing the f-string literal on
+# every request; detail keys repeat heavily across requests of the same
+# action type.
+_APPROVAL_BODY_TMPL = Template("""# Approval Request: ${action_title}
+
+**Action**: ${action_title}
+**Status**: ⏳ Pending Approval
+**Created**: ${created}
+**Timeout**: ${timeout_display}
+
+## Action Details
+
+${details_str}
+
+## Risk Assessment
+
+${risk_str}
+
+## Instructions
+
+To approve this action:
+1. Change `status: pending` to `status: approved` in the YAML frontmatter above
+2. Save the file
+3. The action will execute automatically within 1 minute
+
+To reject this action:
+1. Change `status: pending` to `status: rejected` in the YAML frontmatter above
+2. Add `rejection_reason: "Your reason here"` to the YAML frontmatter
+3. Save the file
+4. The action will be cancelled
+
+## Timeout
+
+If no response within ${timeout_display}, this request will expire and the action will be cancelled.
+""")
+
+
 class ApprovalManager:
     """
     Manages approval requests for sensitive actions.
@@ -56,6 +104,38 @@ class ApprovalManager:
         for folder in [self.pending_folder, self.approved_folder, self.rejected_folder, self.done_folder]:
             ensure_directory_exists(folder)
 
+        # Lookup tables built once so per-call classification is a hash
+        # probe instead of a scan over both config lists
+        self._action_requires_approval: Dict[str, bool] = {
+            action["action_type"]: action["requires_approval"]
+            for action in self.config["sensitive_actions"]
+        }
+        self._action_requires_approval.update({
+            action["action_type"]: action["requires_approval"]
+            for action in self.config["non_sensitive_actions"]
+        })
+        self._action_timeout: Dict[str, int] = {
+            action["action_type"]: action.get("timeout_minutes", 1440)
+            for action in self.config["sensitive_actions"]
+        }
+
+        # Risk factors resolved against config weights once:
+        # (details key, weight, value that triggers, default when absent)
+        weights = self.config["risk_assessment"]["weights"]
+        self._risk_factors = (
+            ("external_recipient", weights.get("external_recipient", 40), True, False),
+            ("reversible", weights.get("irreversible", 30), False, True),
+            ("contains_pii", weights.get("contains_pii", 20), True, False),
+            ("has_cost", weights.get("has_cost", 10), True, False),
+            ("public_visibility", weights.get("public_visibility", 40), True, False),
+            ("professional_reputation", weights.get("professional_reputation", 30), True, False),
+            ("data_loss", weights.get("data_loss", 50), True, False),
+        )
+
+        # Monotonic counter keeps request IDs unique even when several
+        # requests are created within the same nanosecond tick
+        self._seq = itertools.count()
+
         self.logger.info("ApprovalManager initialized")
 
     def is_sensitive_action(self, action_type: str) -> bool:
@@ -68,18 +148,12 @@ class ApprovalManager:
         Returns:
             True if action requires approval, False otherwise
         """
-        # Check sensitive actions
-        for action in self.config["sensitive_actions"]:
-            if action["action_type"] == action_type:
-                return action["requires_approval"]
-
-        # Check non-sensitive actions
-        for action in self.config["non_sensitive_actions"]:
-            if action["action_type"] == action_type:
-                return action["requires_approval"]
+        requires_approval = self._action_requires_approval.get(action_type)
+        if requires_approval is not None:
+            return requires_approval
 
         # Default: require approval for unknown actions
-        self.logger.warning(f"Unknown action type: {action_type}, defaulting to require approval")
+        self.logger.warning("Unknown action type: %s, defaulting to require approval", action_type)
         return True
 
     def calculate_risk_score(self, action_details: Dict[str, Any]) -> int:
@@ -93,29 +167,12 @@ class ApprovalManager:
             Risk score (0-100)
         """
         score = 0
-        weights = self.config["risk_assessment"]["weights"]
-
-        # Check each risk factor
-        if action_details.get("external_recipient"):
-            score += weights.get("external_recipient", 40)
-
-        if not action_details.get("reversible", True):
-            score += weights.get("irreversible", 30)
-
-        if action_details.get("contains_pii"):
-            score += weights.get("contains_pii", 20)
 
-        if action_details.get("has_cost"):
-            score += weights.get("has_cost", 10)
-
-        if action_details.get("public_visibility"):
-            score += weights.get("public_visibility", 40)
-
-        if action_details.get("professional_reputation"):
-            score += weights.get("professional_reputation", 30)
-
-        if action_details.get("data_loss"):
-            score += weights.get("data_loss", 50)
+        # One pass over the factor table built in __init__; no per-call
+        # config chain lookups
+        for key, weight, triggers_when, default in self._risk_factors:
+            if bool(action_details.get(key, default)) is triggers_when:
+                score += weight
 
         return min(score, 100)  # Cap at 100
 
@@ -139,8 +196,11 @@ class ApprovalManager:
         Raises:
             IOError: If approval request file cannot be created
         """
-        # Generate unique request ID
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # Generate unique request ID: hex nanosecond clock plus a process
+        # counter, instead of a second-granularity strftime that collides
+        # when requests arrive in the same second. The human-readable
+        # timestamp stays in the frontmatter and body.
+        timestamp = f"{time.time_ns():x}_{next(self._seq)}"
         request_id = f"approval_{timestamp}_{action_type}"
 
         # Calculate risk score
@@ -165,6 +225,7 @@ class ApprovalManager:
             "status": "pending",
             "created_at": datetime.now().isoformat(),
             "timeout_at": timeout_at.isoformat(),
+            "timeout_minutes": timeout_minutes,
             "risk_level": risk_level,
             "risk_score": risk_score,
         }
@@ -184,7 +245,7 @@ class ApprovalManager:
         content = serialize_frontmatter(frontmatter, body)
         write_file(file_path, content)
 
-        self.logger.info(f"Created approval request: {request_id}")
+        self.logger.info("Created approval request: %s", request_id)
         return request_id
 
     def _get_timeout_for_action(self, action_type: str) -> int:
@@ -197,11 +258,7 @@ class ApprovalManager:
         Returns:
             Timeout in minutes
         """
-        for action in self.config["sensitive_actions"]:
-            if action["action_type"] == action_type:
-                return action.get("timeout_minutes", 1440)  # Default: 24 hours
-
-        return 1440  # Default: 24 hours
+        return self._action_timeout.get(action_type, 1440)  # Default: 24 hours
 
     def _create_approval_body(
         self,
@@ -223,20 +280,18 @@ class ApprovalManager:
             Markdown body content
         """
         # Format action type for display
-        action_title = action_type.replace("_", " ").title()
+        action_title = _title_key(action_type)
 
         # Format action details
         details_lines = []
         for key, value in action_details.items():
-            formatted_key = key.replace("_", " ").title()
-            details_lines.append(f"- **{formatted_key}**: {value}")
+            details_lines.append(f"- **{_title_key(key)}**: {value}")
         details_str = "\n".join(details_lines)
 
         # Format risk assessment
         risk_lines = []
         for key, value in risk_assessment.items():
-            formatted_key = key.replace("_", " ").title()
-            risk_lines.append(f"- **{formatted_key}**: {value}")
+            risk_lines.append(f"- **{_title_key(key)}**: {value}")
         risk_str = "\n".join(risk_lines) if risk_lines else "- No specific risks identified"
 
         # Format timeout
@@ -246,41 +301,15 @@ class ApprovalManager:
         else:
             timeout_display = f"{int(timeout_hours)} hours"
 
-        body = f"""# Approval Request: {action_title}
-
-**Action**: {action_title}
-**Status**: ⏳ Pending Approval
-**Created**: {datetime.now().strftime('%Y-%m-%d %I:%M %p')}
-**Timeout**: {timeout_display}
-
-## Action Details
-
-{details_str}
-
-## Risk Assessment
-
-{risk_str}
-
-## Instructions
-
-To approve this action:
-1. Change `status: pending` to `status: approved` in the YAML frontmatter above
-2. Save the file
-3. The action will execute automatically within 1 minute
-
-To reject this action:
-1. Change `status: pending` to `status: rejected` in the YAML frontmatter above
-2. Add `rejection_reason: "Your reason here"` to the YAML frontmatter
-3. Save the file
-4. The action will be cancelled
-
-## Timeout
-
-If no response within {timeout_display}, this request will expire and the action will be cancelled.
-"""
-        return body
+        return _APPROVAL_BODY_TMPL.substitute(
+            action_title=action_title,
+            created=datetime.now().strftime('%Y-%m-%d %I:%M %p'),
+            timeout_display=timeout_display,
+            details_str=details_str,
+            risk_str=risk_str,
+        )
 
-    def execute_approved_action(
+    async def execute_approved_action(
         self,
         request_id: str,
         max_retries: int = 3,
@@ -289,6 +318,10 @@ If no response within {timeout_display}, this request will expire and the action
         """
         Execute an approved action with retry logic.
 
+        Retries wait with asyncio.sleep plus a small random jitter, so the
+        event loop stays responsive and concurrent failures don't retry in
+        lockstep.
+
         Args:
             request_id: Approval request ID
             max_retries: Maximum number of retry attempts
@@ -314,7 +347,7 @@ If no response within {timeout_display}, this request will expire and the action
 
         # TODO: Implement actual action execution
         # For now, this is a placeholder that will be implemented in Phase 7
-        self.logger.info(f"Executing approved action: {request_id}")
+        self.logger.info("Executing approved action: %s", request_id)
 
         # Simulate execution with retry logic
         last_error = None
@@ -322,7 +355,7 @@ If no response within {timeout_display}, this request will expire and the action
             try:
                 # TODO: Execute actual action based on action_type
                 # This will be implemented when we add ActionExecutor in Phase 7
-                self.logger.info(f"Attempt {attempt + 1}/{max_retries}")
+                self.logger.info("Attempt %s/%s", attempt + 1, max_retries)
 
                 # For now, just mark as successful
                 result = {
@@ -336,21 +369,21 @@ If no response within {timeout_display}, this request will expire and the action
                 done_path = self.done_folder / f"{request_id}.md"
                 move_file(file_path, done_path)
 
-                self.logger.info(f"Action executed successfully: {request_id}")
+                self.logger.info("Action executed successfully: %s", request_id)
                 return result
 
             except Exception as e:
                 last_error = e
-                self.logger.warning(f"Attempt {attempt + 1} failed: {e}")
+                self.logger.warning("Attempt %s failed: %s", attempt + 1, e)
 
                 # Retry with delay if not last attempt
                 if attempt < max_retries - 1:
                     delay = retry_delays[attempt]
-                    self.logger.info(f"Retrying in {delay} seconds...")
-                    time.sleep(delay)
+                    self.logger.info("Retrying in %s seconds...", delay)
+                    await asyncio.sleep(delay + random.uniform(0, delay * 0.1))
 
         # All retries failed
-        self.logger.error(f"Action execution failed after {max_retries} attempts: {last_error}")
+        self.logger.error("Action execution failed after %s attempts: %s", max_retries, last_error)
         return {
             "success": False,
             "error": str(last_error),
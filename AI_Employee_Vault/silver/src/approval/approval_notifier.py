@@ -40,6 +40,24 @@ class ApprovalNotifier:
         # Load configuration
         self.config = load_yaml_file(str(self.config_path))
 
+        # Table-driven notification dispatch: one dict lookup per
+        # notification instead of an if/elif chain per action type and
+        # another per risk level. Built before the enabled checks so
+        # notify_approval_request works (as a no-op) on disabled notifiers.
+        self._msg_builders = {
+            "send_email": lambda d: (
+                f"Send email to {d.get('to', 'unknown')}\n"
+                f"Subject: {d.get('subject', '')}"
+            ),
+            "delete_file": lambda d: f"Delete file: {d.get('file_path', 'unknown')}",
+            "post_linkedin": lambda d: "Post to LinkedIn",
+        }
+        self._risk_to_urgency = {
+            "high": "critical",
+            "low": "low",
+            "normal": "normal",
+        }
+
         # Check if notifications are enabled
         self.enabled = self.config["notification_settings"]["enabled"]
 
@@ -117,33 +135,19 @@ class ApprovalNotifier:
         Returns:
             True if notification sent successfully
         """
-        # Format action type for display
-        action_title = action_type.replace("_", " ").title()
-
-        # Create notification message
         title = "Approval Required"
 
         # Create concise message based on action type
-        if action_type == "send_email":
-            to = action_details.get("to", "unknown")
-            subject = action_details.get("subject", "")
-            message = f"Send email to {to}\nSubject: {subject}"
-        elif action_type == "delete_file":
-            file_path = action_details.get("file_path", "unknown")
-            message = f"Delete file: {file_path}"
-        elif action_type == "post_linkedin":
-            message = f"Post to LinkedIn"
+        build = self._msg_builders.get(action_type)
+        if build:
+            message = build(action_details)
         else:
-            message = f"{action_title} requires approval"
+            message = f"{action_type.replace('_', ' ').title()} requires approval"
 
         # Determine urgency
-        risk_level = action_details.get("risk_level", "normal")
-        if risk_level == "high":
-            urgency = "critical"
-        elif risk_level == "low":
-            urgency = "low"
-        else:
-            urgency = "normal"
+        urgency = self._risk_to_urgency.get(
+            action_details.get("risk_level", "normal"), "normal"
+        )
 
         # Send notification
         return self.send_notification(
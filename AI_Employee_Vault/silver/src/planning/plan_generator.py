@@ -5,9 +5,12 @@ This module analyzes incoming action requests and generates structured
 execution plans with complexity assessment and risk analysis.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
+import functools
+import os
 import re
 import logging
 
@@ -18,10 +21,175 @@ from ..utils import (
     serialize_frontmatter,
     read_file,
     write_file,
-    list_files,
     ensure_directory_exists,
 )
 
+# Keyword sets compiled once into a single alternation each, so a
+# predicate makes one pass over the body instead of one substring scan
+# per keyword (and no lowercased copy of the whole body)
+_EXTERNAL_DATA_KEYWORDS = (
+    "research",
+    "find information",
+    "look up",
+    "search online",
+    "get data from",
+)
+_VAULT_SEARCH_KEYWORDS = (
+    "in my notes",
+    "from vault",
+    "in obsidian",
+    "my previous",
+    "find in",
+)
+_EXT_DATA_RE = re.compile(
+    "|".join(map(re.escape, _EXTERNAL_DATA_KEYWORDS)), re.IGNORECASE
+)
+_VAULT_RE = re.compile(
+    "|".join(map(re.escape, _VAULT_SEARCH_KEYWORDS)), re.IGNORECASE
+)
+
+# Step and prerequisite templates are static per action type; shared
+# tuples at module scope mean a generated plan costs one shallow list()
+# instead of rebuilding every dict and string literal per call
+_STEPS_BY_TYPE = {
+    "send_email": (
+        {
+            "step": "1",
+            "action": "Extract email details",
+            "description": "Parse recipient, subject, and body from request",
+        },
+        {
+            "step": "2",
+            "action": "Draft email content",
+            "description": "Compose professional email based on request",
+        },
+        {
+            "step": "3",
+            "action": "Request approval",
+            "description": "Create approval request for email sending",
+        },
+        {
+            "step": "4",
+            "action": "Send email",
+            "description": "Execute email sending via Gmail API",
+        },
+        {
+            "step": "5",
+            "action": "Confirm delivery",
+            "description": "Verify email was sent successfully",
+        },
+    ),
+    "research": (
+        {
+            "step": "1",
+            "action": "Define research scope",
+            "description": "Identify key topics and questions",
+        },
+        {
+            "step": "2",
+            "action": "Search vault",
+            "description": "Search existing notes for relevant information",
+        },
+        {
+            "step": "3",
+            "action": "Analyze findings",
+            "description": "Synthesize information from vault",
+        },
+        {
+            "step": "4",
+            "action": "Create summary",
+            "description": "Generate research summary document",
+        },
+    ),
+    "create_plan": (
+        {
+            "step": "1",
+            "action": "Analyze request",
+            "description": "Understand goals and constraints",
+        },
+        {
+            "step": "2",
+            "action": "Break down tasks",
+            "description": "Identify individual tasks and dependencies",
+        },
+        {
+            "step": "3",
+            "action": "Assess resources",
+            "description": "Determine required resources and timeline",
+        },
+        {
+            "step": "4",
+            "action": "Generate plan",
+            "description": "Create structured execution plan",
+        },
+    ),
+}
+
+_PREREQS_BY_TYPE = {
+    "send_email": (
+        "Gmail API credentials configured",
+        "Recipient email address validated",
+        "Email content approved (if required)",
+    ),
+    "post_linkedin": (
+        "LinkedIn API credentials configured",
+        "Post content approved",
+        "Account has posting permissions",
+    ),
+    "research": (
+        "Vault search functionality available",
+        "Research scope clearly defined",
+    ),
+}
+
+_GENERIC_PREREQS = (
+    "Required permissions available",
+    "Dependencies satisfied",
+)
+
+# Complexity scoring tables: (base_steps, research_needed) per action
+# type, and (details key, factors key, value) applied in order - later
+# rows overwrite earlier ones for the same factor, preserving the
+# precedence the old branch chain had
+_BASE_STEPS_BY_TYPE = {
+    "send_email": (2, 0),
+    "post_linkedin": (2, 0),
+    "research": (3, 1),
+    "analyze": (3, 1),
+    "create_plan": (4, 1),
+    "generate_report": (4, 1),
+}
+_COMPLEXITY_FACTORS = (
+    ("requires_external_data", "external_dependencies", 2),
+    ("requires_api_call", "external_dependencies", 1),
+    ("requires_vault_search", "data_requirements", 1),
+    ("requires_file_analysis", "data_requirements", 2),
+    ("requires_approval", "approval_needed", 1),
+    ("multi_channel", "multi_channel", 2),
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _generic_steps(action_type: str) -> tuple:
+    """Generic step template, cached per action type."""
+    return (
+        {
+            "step": "1",
+            "action": "Analyze request",
+            "description": "Understand requirements and context",
+        },
+        {
+            "step": "2",
+            "action": "Execute action",
+            "description": f"Perform {action_type} operation",
+        },
+        {
+            "step": "3",
+            "action": "Verify completion",
+            "description": "Confirm action completed successfully",
+        },
+    )
+
 
 class PlanGenerator:
     """
@@ -75,51 +243,24 @@ class PlanGenerator:
             - estimated_steps: Estimated number of steps
             - factors: Dictionary of complexity factors
         """
+        # Analyze action type
+        action_type = action_details.get("action_type", "unknown")
+
+        # Base complexity by action type, then one pass over the factor
+        # table instead of a branch per flag
+        base_steps, research_needed = _BASE_STEPS_BY_TYPE.get(action_type, (2, 0))
         factors = {
-            "base_steps": 1,
+            "base_steps": base_steps,
             "external_dependencies": 0,
             "data_requirements": 0,
             "approval_needed": 0,
             "multi_channel": 0,
-            "research_needed": 0,
+            "research_needed": research_needed,
         }
 
-        # Analyze action type
-        action_type = action_details.get("action_type", "unknown")
-
-        # Base complexity by action type
-        if action_type in ["send_email", "post_linkedin"]:
-            factors["base_steps"] = 2  # Draft + Send
-        elif action_type in ["research", "analyze"]:
-            factors["base_steps"] = 3  # Search + Analyze + Summarize
-            factors["research_needed"] = 1
-        elif action_type in ["create_plan", "generate_report"]:
-            factors["base_steps"] = 4  # Gather + Analyze + Draft + Review
-            factors["research_needed"] = 1
-        else:
-            factors["base_steps"] = 2
-
-        # Check for external dependencies
-        if action_details.get("requires_external_data"):
-            factors["external_dependencies"] = 2
-
-        if action_details.get("requires_api_call"):
-            factors["external_dependencies"] = 1
-
-        # Check for data requirements
-        if action_details.get("requires_vault_search"):
-            factors["data_requirements"] = 1
-
-        if action_details.get("requires_file_analysis"):
-            factors["data_requirements"] = 2
-
-        # Check if approval needed
-        if action_details.get("requires_approval"):
-            factors["approval_needed"] = 1
-
-        # Check for multi-channel coordination
-        if action_details.get("multi_channel"):
-            factors["multi_channel"] = 2
+        for details_key, factor_key, value in _COMPLEXITY_FACTORS:
+            if action_details.get(details_key):
+                factors[factor_key] = value
 
         # Calculate total estimated steps
         estimated_steps = sum(factors.values())
@@ -192,8 +333,14 @@ class PlanGenerator:
         else:
             _, estimated_steps, factors = self.assess_complexity(action_details)
 
+        # One clock read per plan: the ID timestamp, created_at,
+        # updated_at and the display time all derive from the same
+        # instant, so created_at == updated_at holds by construction
+        now = datetime.now()
+        now_iso = now.isoformat()
+
         # Generate plan ID
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
         plan_id = f"plan_{timestamp}_{action_type}"
 
         # Generate plan steps
@@ -218,8 +365,8 @@ class PlanGenerator:
             "status": "pending",
             "complexity": complexity_level,
             "estimated_steps": estimated_steps,
-            "created_at": datetime.now().isoformat(),
-            "updated_at": datetime.now().isoformat(),
+            "created_at": now_iso,
+            "updated_at": now_iso,
         }
 
         # Create plan body
@@ -232,6 +379,7 @@ class PlanGenerator:
             risk_assessment=risk_assessment,
             complexity_level=complexity_level,
             estimated_steps=estimated_steps,
+            created=now.strftime('%Y-%m-%d %I:%M %p'),
         )
 
         # Write plan file
@@ -256,27 +404,11 @@ class PlanGenerator:
 
     def _requires_external_data(self, body: str) -> bool:
         """Check if request requires external data."""
-        keywords = [
-            "research",
-            "find information",
-            "look up",
-            "search online",
-            "get data from",
-        ]
-        body_lower = body.lower()
-        return any(keyword in body_lower for keyword in keywords)
+        return _EXT_DATA_RE.search(body) is not None
 
     def _requires_vault_search(self, body: str) -> bool:
         """Check if request requires vault search."""
-        keywords = [
-            "in my notes",
-            "from vault",
-            "in obsidian",
-            "my previous",
-            "find in",
-        ]
-        body_lower = body.lower()
-        return any(keyword in body_lower for keyword in keywords)
+        return _VAULT_RE.search(body) is not None
 
     def _generate_steps(
         self,
@@ -285,107 +417,11 @@ class PlanGenerator:
         original_request: str
     ) -> List[Dict[str, str]]:
         """Generate execution steps for the plan."""
-        steps = []
-
-        # Common patterns by action type
-        if action_type == "send_email":
-            steps = [
-                {
-                    "step": "1",
-                    "action": "Extract email details",
-                    "description": "Parse recipient, subject, and body from request",
-                },
-                {
-                    "step": "2",
-                    "action": "Draft email content",
-                    "description": "Compose professional email based on request",
-                },
-                {
-                    "step": "3",
-                    "action": "Request approval",
-                    "description": "Create approval request for email sending",
-                },
-                {
-                    "step": "4",
-                    "action": "Send email",
-                    "description": "Execute email sending via Gmail API",
-                },
-                {
-                    "step": "5",
-                    "action": "Confirm delivery",
-                    "description": "Verify email was sent successfully",
-                },
-            ]
-
-        elif action_type == "research":
-            steps = [
-                {
-                    "step": "1",
-                    "action": "Define research scope",
-                    "description": "Identify key topics and questions",
-                },
-                {
-                    "step": "2",
-                    "action": "Search vault",
-                    "description": "Search existing notes for relevant information",
-                },
-                {
-                    "step": "3",
-                    "action": "Analyze findings",
-                    "description": "Synthesize information from vault",
-                },
-                {
-                    "step": "4",
-                    "action": "Create summary",
-                    "description": "Generate research summary document",
-                },
-            ]
-
-        elif action_type == "create_plan":
-            steps = [
-                {
-                    "step": "1",
-                    "action": "Analyze request",
-                    "description": "Understand goals and constraints",
-                },
-                {
-                    "step": "2",
-                    "action": "Break down tasks",
-                    "description": "Identify individual tasks and dependencies",
-                },
-                {
-                    "step": "3",
-                    "action": "Assess resources",
-                    "description": "Determine required resources and timeline",
-                },
-                {
-                    "step": "4",
-                    "action": "Generate plan",
-                    "description": "Create structured execution plan",
-                },
-            ]
-
-        else:
-            # Generic steps
-            steps = [
-                {
-                    "step": "1",
-                    "action": "Analyze request",
-                    "description": "Understand requirements and context",
-                },
-                {
-                    "step": "2",
-                    "action": "Execute action",
-                    "description": f"Perform {action_type} operation",
-                },
-                {
-                    "step": "3",
-                    "action": "Verify completion",
-                    "description": "Confirm action completed successfully",
-                },
-            ]
-
-        return steps
+        template = _STEPS_BY_TYPE.get(action_type)
+        if template is None:
+            template = _generic_steps(action_type)
+        # Shallow copy: callers only read the step dicts
+        return list(template)
 
     def _generate_prerequisites(
         self,
@@ -393,34 +429,9 @@ class PlanGenerator:
         action_details: Dict[str, Any]
     ) -> List[str]:
         """Generate prerequisites for the plan."""
-        prerequisites = []
-
-        # Common prerequisites by action type
-        if action_type == "send_email":
-            prerequisites = [
-                "Gmail API credentials configured",
-                "Recipient email address validated",
-                "Email content approved (if required)",
-            ]
-
-        elif action_type == "post_linkedin":
-            prerequisites = [
-                "LinkedIn API credentials configured",
-                "Post content approved",
-                "Account has posting permissions",
-            ]
-
-        elif action_type == "research":
-            prerequisites = [
-                "Vault search functionality available",
-                "Research scope clearly defined",
-            ]
-
-        else:
-            prerequisites = [
-                "Required permissions available",
-                "Dependencies satisfied",
-            ]
+        prerequisites = list(
+            _PREREQS_BY_TYPE.get(action_type, _GENERIC_PREREQS)
+        )
 
         # Add approval prerequisite if needed
         if action_details.get("requires_approval"):
@@ -493,37 +504,23 @@ class PlanGenerator:
         risk_assessment: Dict[str, Any],
         complexity_level: str,
         estimated_steps: int,
+        created: str,
     ) -> str:
         """Create plan body content."""
         # Format action type for display
         action_title = action_type.replace("_", " ").title()
 
-        # Format steps
-        steps_lines = []
-        for step in steps:
-            steps_lines.append(
-                f"### Step {step['step']}: {step['action']}\n\n"
-                f"{step['description']}\n"
-            )
-        steps_str = "\n".join(steps_lines)
-
-        # Format prerequisites
-        prereq_lines = [f"- {prereq}" for prereq in prerequisites]
-        prereq_str = "\n".join(prereq_lines)
-
-        # Format risk assessment
-        risk_factors = "\n".join([f"- {factor}" for factor in risk_assessment["factors"]])
-        risk_mitigation = "\n".join([f"- {mit}" for mit in risk_assessment["mitigation"]])
+        # Extract original request summary: bounded split keeps only the
+        # first 5 lines instead of materializing every line of the body
+        request_summary = "\n".join(original_request.split("\n", 5)[:5])
 
-        # Extract original request summary
-        request_lines = original_request.split("\n")
-        request_summary = "\n".join(request_lines[:5])  # First 5 lines
-
-        body = f"""# Execution Plan: {action_title}
+        # Assemble the body as one parts list joined once, instead of
+        # four list+join cycles feeding a large intermediate f-string
+        parts: List[str] = [f"""# Execution Plan: {action_title}
 
 **Status**: ⏳ Pending Execution
 **Complexity**: {complexity_level.title()} ({estimated_steps} steps)
-**Created**: {datetime.now().strftime('%Y-%m-%d %I:%M %p')}
+**Created**: {created}
 
 ## Original Request
 
@@ -535,22 +532,27 @@ Execute {action_title} as requested, ensuring all prerequisites are met and risk
 
 ## Prerequisites
 
-{prereq_str}
-
-## Execution Steps
-
-{steps_str}
+"""]
+        parts.extend(f"- {prereq}\n" for prereq in prerequisites)
 
-## Risk Assessment
-
-**Overall Risk**: {risk_assessment['overall_risk'].upper()}
+        parts.append("\n## Execution Steps\n\n")
+        parts.extend(
+            f"### Step {step['step']}: {step['action']}\n\n"
+            f"{step['description']}\n\n"
+            for step in steps
+        )
 
-### Risk Factors
-{risk_factors}
+        parts.append(
+            "\n## Risk Assessment\n\n"
+            f"**Overall Risk**: {risk_assessment['overall_risk'].upper()}\n\n"
+            "### Risk Factors\n"
+        )
+        parts.extend(f"- {factor}\n" for factor in risk_assessment["factors"])
 
-### Mitigation Strategies
-{risk_mitigation}
+        parts.append("\n### Mitigation Strategies\n")
+        parts.extend(f"- {mit}\n" for mit in risk_assessment["mitigation"])
 
+        parts.append("""
 ## Expected Outcome
 
 - Action completed successfully
@@ -563,31 +565,53 @@ Execute {action_title} as requested, ensuring all prerequisites are met and risk
 - This plan was automatically generated based on the action request
 - Review and modify steps as needed before execution
 - Update status in frontmatter as plan progresses
-"""
-        return body
+""")
+        return "".join(parts)
 
     def generate_plans_for_pending_actions(self) -> List[str]:
         """
         Generate plans for all pending actions in Needs_Action folder.
 
+        Per-file work (read, parse, assess, write) shares no state, so a
+        backlog is fanned out across a thread pool and the reads/writes
+        overlap instead of serializing on disk latency.
+
         Returns:
-            List of generated plan IDs
+            List of generated plan IDs, in action-file order
         """
         plan_ids = []
 
         try:
-            # Get all action files
-            action_files = list_files(self.needs_action_folder, "*.md")
+            # Enumerate action files with scandir: DirEntry carries the
+            # file-type info from the directory read, so no per-entry
+            # stat or glob machinery
+            try:
+                with os.scandir(self.needs_action_folder) as entries:
+                    action_files = [
+                        Path(entry.path)
+                        for entry in entries
+                        if entry.name.endswith(".md") and entry.is_file()
+                    ]
+            except FileNotFoundError:
+                action_files = []
             self.logger.info(f"Found {len(action_files)} pending actions")
 
-            for action_file in action_files:
-                try:
-                    plan_id = self.generate_plan(action_file)
-                    plan_ids.append(plan_id)
-                except Exception as e:
-                    self.logger.error(
-                        f"Failed to generate plan for {action_file}: {e}"
-                    )
+            if not action_files:
+                return []
+
+            max_workers = min(32, (os.cpu_count() or 1) * 4)
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                futures = [
+                    pool.submit(self.generate_plan, action_file)
+                    for action_file in action_files
+                ]
+                for action_file, future in zip(action_files, futures):
+                    try:
+                        plan_ids.append(future.result())
+                    except Exception as e:
+                        self.logger.error(
+                            f"Failed to generate plan for {action_file}: {e}"
+                        )
 
             return plan_ids
 
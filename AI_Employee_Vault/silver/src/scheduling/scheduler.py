@@ -180,6 +180,22 @@ class Scheduler:
             self.logger.error(f"Failed to schedule task {task_id}: {e}")
             return False
 
+    def schedule_tasks(self, tasks: List[Dict[str, Any]]) -> List[bool]:
+        """
+        Schedule a batch of recurring tasks in one call.
+
+        Args:
+            tasks: List of dictionaries with the same keys as
+                schedule_task's arguments (task_id, task_func,
+                schedule_type, schedule_config, optional description)
+
+        Returns:
+            List of per-task success flags, in input order
+        """
+        results = [self.schedule_task(**task) for task in tasks]
+        self.logger.info(f"Scheduled {sum(results)}/{len(results)} tasks in batch")
+        return results
+
     def unschedule_task(self, task_id: str) -> bool:
         """
         Unschedule a recurring task.
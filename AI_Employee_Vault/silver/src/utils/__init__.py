@@ -10,8 +10,10 @@ from .yaml_parser import (
     serialize_frontmatter,
     update_frontmatter_field,
     get_frontmatter_field,
+    read_frontmatter_only,
     load_yaml_file,
     save_yaml_file,
+    clear_yaml_cache,
 )
 from .file_utils import (
     ensure_directory_exists,
@@ -34,8 +36,10 @@ __all__ = [
     "serialize_frontmatter",
     "update_frontmatter_field",
     "get_frontmatter_field",
+    "read_frontmatter_only",
     "load_yaml_file",
     "save_yaml_file",
+    "clear_yaml_cache",
     # File operations
     "ensure_directory_exists",
     "read_file",
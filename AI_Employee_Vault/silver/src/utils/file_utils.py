@@ -13,19 +13,31 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Directories already created or verified this process; write_file and
+# move_file call ensure_directory_exists on every write, so without this
+# each write pays a redundant mkdir syscall chain
+_DIRS_ENSURED: set = set()
+
 
 def ensure_directory_exists(directory: Path) -> None:
     """
     Ensure a directory exists, creating it if necessary.
 
+    Directories verified once are remembered for the life of the
+    process, so repeated calls for the same path skip the mkdir.
+
     Args:
         directory: Path to the directory
 
     Raises:
         OSError: If directory cannot be created
     """
+    key = str(directory)
+    if key in _DIRS_ENSURED:
+        return
     try:
         directory.mkdir(parents=True, exist_ok=True)
+        _DIRS_ENSURED.add(key)
         logger.debug(f"Ensured directory exists: {directory}")
     except OSError as e:
         logger.error(f"Failed to create directory {directory}: {e}")
@@ -74,8 +86,10 @@ def write_file(file_path: Path, content: str) -> None:
         # Ensure parent directory exists
         ensure_directory_exists(file_path.parent)
 
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        # Encode once and write the bytes in one call, skipping the
+        # TextIOWrapper's incremental encoder and its extra buffer layer
+        with open(file_path, 'wb') as f:
+            f.write(content.encode('utf-8'))
         logger.debug(f"Wrote file: {file_path}")
     except IOError as e:
         logger.error(f"Failed to write file {file_path}: {e}")
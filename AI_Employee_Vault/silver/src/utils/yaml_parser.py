@@ -5,13 +5,38 @@ This module provides helper functions for parsing and manipulating
 YAML frontmatter in markdown files.
 """
 
+import copy
+import os
 import re
+import threading
+from collections import OrderedDict
 from typing import Dict, Any, Tuple, Optional
 import yaml
 import logging
 
+# libyaml-backed loader/dumper when PyYAML was compiled against it; same
+# safe semantics, typically 5-10x faster than the pure-Python classes
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+try:
+    from yaml import CSafeDumper as _SafeDumper
+except ImportError:
+    from yaml import SafeDumper as _SafeDumper
+
 logger = logging.getLogger(__name__)
 
+# Parsed-config cache keyed on path, validated by (mtime, size). Config
+# files are loaded by several components per process (checker, manager,
+# executor all read the same approval rules), so repeat loads cost a
+# stat instead of a full YAML parse. Bounded LRU; deep copies on both
+# sides keep callers from mutating each other's view.
+_YAML_CACHE: "OrderedDict[str, Tuple[float, int, Dict[str, Any]]]" = OrderedDict()
+_YAML_CACHE_MAX = 100
+_YAML_CACHE_LOCK = threading.Lock()
+
 
 def parse_frontmatter(content: str) -> Tuple[Dict[str, Any], str]:
     """
@@ -31,19 +56,27 @@ def parse_frontmatter(content: str) -> Tuple[Dict[str, Any], str]:
         >>> body
         'Body text'
     """
-    # Match YAML frontmatter between --- delimiters
-    pattern = r'^---\s*\n(.*?)\n---\s*\n(.*)$'
-    match = re.match(pattern, content, re.DOTALL)
-
-    if not match:
-        logger.warning("No YAML frontmatter found in content")
-        return {}, content
+    # Fast path: frontmatter always starts at offset 0, so two plain
+    # splits find the delimiters without the DOTALL regex walking the
+    # whole body character by character
+    frontmatter_str = None
+    if content.startswith('---\n'):
+        try:
+            _, frontmatter_str, body = content.split('---\n', 2)
+        except ValueError:
+            pass
+
+    if frontmatter_str is None:
+        # Delimiters with trailing whitespace or no clean closing ---;
+        # fall back to the tolerant regex
+        match = re.match(r'^---\s*\n(.*?)\n---\s*\n(.*)$', content, re.DOTALL)
+        if not match:
+            logger.warning("No YAML frontmatter found in content")
+            return {}, content
+        frontmatter_str, body = match.group(1), match.group(2)
 
     try:
-        frontmatter_str = match.group(1)
-        body = match.group(2)
-
-        frontmatter = yaml.safe_load(frontmatter_str) or {}
+        frontmatter = yaml.load(frontmatter_str, Loader=_SafeLoader) or {}
         logger.debug(f"Parsed frontmatter: {len(frontmatter)} fields")
 
         return frontmatter, body
@@ -76,9 +109,10 @@ def serialize_frontmatter(frontmatter: Dict[str, Any], body: str) -> str:
         Body text
     """
     try:
-        # Serialize frontmatter to YAML
+        # Serialize frontmatter to YAML, preserving insertion order
         frontmatter_str = yaml.dump(
             frontmatter,
+            Dumper=_SafeDumper,
             default_flow_style=False,
             allow_unicode=True,
             sort_keys=False
@@ -117,6 +151,11 @@ def update_frontmatter_field(
         >>> # status is now 'approved'
     """
     frontmatter, body = parse_frontmatter(content)
+
+    # Short-circuit: nothing to change, skip the re-dump entirely
+    if field in frontmatter and frontmatter[field] == value:
+        return content
+
     frontmatter[field] = value
     return serialize_frontmatter(frontmatter, body)
 
@@ -148,6 +187,42 @@ def get_frontmatter_field(
     return frontmatter.get(field, default)
 
 
+def read_frontmatter_only(file_path: str) -> Dict[str, Any]:
+    """
+    Parse just the YAML frontmatter of a markdown file.
+
+    Reads at most the first 8 KiB and parses up to the closing ---
+    delimiter, so status checks on large files never touch the body.
+
+    Args:
+        file_path: Path to markdown file
+
+    Returns:
+        Frontmatter dictionary, or {} if no frontmatter is found
+
+    Raises:
+        FileNotFoundError: If file doesn't exist
+    """
+    with open(file_path, 'rb') as f:
+        head = f.read(8192)
+
+    if not head.startswith(b'---'):
+        logger.warning(f"No YAML frontmatter found in {file_path}")
+        return {}
+
+    end = head.find(b'\n---', 3)
+    if end == -1:
+        logger.warning(f"Unterminated YAML frontmatter in {file_path}")
+        return {}
+
+    block = head[head.find(b'\n') + 1:end]
+    try:
+        return yaml.load(block.decode('utf-8', 'replace'), Loader=_SafeLoader) or {}
+    except yaml.YAMLError as e:
+        logger.error(f"Failed to parse YAML frontmatter in {file_path}: {e}")
+        return {}
+
+
 def load_yaml_file(file_path: str) -> Dict[str, Any]:
     """
     Load YAML configuration from a file.
@@ -162,11 +237,26 @@ def load_yaml_file(file_path: str) -> Dict[str, Any]:
         FileNotFoundError: If file doesn't exist
         yaml.YAMLError: If YAML is invalid
     """
+    try:
+        stat = os.stat(file_path)
+    except FileNotFoundError:
+        logger.error(f"YAML file not found: {file_path}")
+        raise
+
+    key = str(file_path)
+    with _YAML_CACHE_LOCK:
+        cached = _YAML_CACHE.get(key)
+        if (cached is not None
+                and cached[0] == stat.st_mtime
+                and cached[1] == stat.st_size):
+            _YAML_CACHE.move_to_end(key)
+            logger.debug(f"YAML cache hit for {file_path}")
+            return copy.deepcopy(cached[2])
+
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
-            config = yaml.safe_load(f) or {}
+            config = yaml.load(f, Loader=_SafeLoader) or {}
         logger.info(f"Loaded YAML config from {file_path}")
-        return config
     except FileNotFoundError:
         logger.error(f"YAML file not found: {file_path}")
         raise
@@ -174,6 +264,26 @@ def load_yaml_file(file_path: str) -> Dict[str, Any]:
         logger.error(f"Failed to parse YAML file {file_path}: {e}")
         raise
 
+    with _YAML_CACHE_LOCK:
+        _YAML_CACHE[key] = (stat.st_mtime, stat.st_size, copy.deepcopy(config))
+        _YAML_CACHE.move_to_end(key)
+        while len(_YAML_CACHE) > _YAML_CACHE_MAX:
+            _YAML_CACHE.popitem(last=False)
+
+    return config
+
+
+def clear_yaml_cache() -> None:
+    """
+    Drop all cached YAML configs.
+
+    Intended for tests that rewrite a config file in place and need the
+    next load_yaml_file call to re-read it regardless of filesystem
+    mtime granularity.
+    """
+    with _YAML_CACHE_LOCK:
+        _YAML_CACHE.clear()
+
 
 def save_yaml_file(file_path: str, data: Dict[str, Any]) -> None:
     """
@@ -192,6 +302,7 @@ def save_yaml_file(file_path: str, data: Dict[str, Any]) -> None:
             yaml.dump(
                 data,
                 f,
+                Dumper=_SafeDumper,
                 default_flow_style=False,
                 allow_unicode=True,
                 sort_keys=False